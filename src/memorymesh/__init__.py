@@ -56,14 +56,14 @@ from .formats import (
     sync_to_all,
     sync_to_format,
 )
-from .html_export import generate_html
+from .html_export import generate_html, generate_html_to_file
 from .mcp_server import MemoryMeshMCPServer
 from .memory import GLOBAL_SCOPE, PROJECT_SCOPE, Memory, validate_scope
 from .privacy import check_for_secrets, redact_secrets
 from .relevance import RelevanceEngine, RelevanceWeights
 from .report import generate_report
 from .review import ReviewIssue, ReviewResult, review_memories
-from .store import MemoryStore, detect_project_root
+from .store import MemoryStore, clear_project_root_cache, detect_project_root
 from .sync import sync_from_memory_md, sync_to_memory_md
 
 __all__ = [
@@ -102,6 +102,7 @@ __all__ = [
     # Storage
     "MemoryStore",
     "detect_project_root",
+    "clear_project_root_cache",
     # Embeddings
     "EmbeddingProvider",
     "LocalEmbedding",
@@ -111,6 +112,7 @@ __all__ = [
     "create_embedding_provider",
     # HTML Export
     "generate_html",
+    "generate_html_to_file",
     # Sync (legacy)
     "sync_to_memory_md",
     "sync_from_memory_md",
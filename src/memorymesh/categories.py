@@ -9,6 +9,7 @@ Uses **only the Python standard library** -- no external dependencies.
 
 from __future__ import annotations
 
+import functools
 import re
 from typing import Any
 
@@ -242,6 +243,50 @@ _PROJECT_SUBJECT_PATTERNS: list[re.Pattern[str]] = [
 ]
 
 
+# Prefilters.  Every subject pattern needs at least one of these substrings
+# in the lowercased text, so a handful of C-level ``in`` checks rules out the
+# common case of no subject signal before any regex runs.  The only other
+# project signal, the version pattern, also needs an ISO date.
+_USER_SUBJECT_HINTS: tuple[str, ...] = (
+    "user",
+    "'s",
+    "\u2019s",
+    "project",
+    "global",
+    "interaction",
+    "style",
+    "preference",
+)
+_PROJECT_SUBJECT_HINTS: tuple[str, ...] = (
+    "src/",
+    "test/",
+    "tests/",
+    ".py",
+    ".ts",
+    ".js",
+    ".go",
+    ".rs",
+    ".toml",
+    ".json",
+    ".mod",
+    ".md",
+    "implement",
+    "pass",
+    "commit",
+)
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# Characters that IGNORECASE regexes equate with an ASCII letter but that
+# ``str.lower`` does not turn into that letter.
+_ASCII_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s"})
+
+
+@functools.lru_cache(maxsize=32)
+def _project_name_pattern(project_name: str) -> re.Pattern[str]:
+    """Compile (once per name) the whole-word matcher for a project name."""
+    return re.compile(rf"\b{re.escape(project_name)}\b", re.IGNORECASE)
+
+
 def infer_scope(
     text: str,
     category_scope: str | None = None,
@@ -275,19 +320,19 @@ def infer_scope(
     user_score = 0
     project_score = 0
 
-    for pattern in _USER_SUBJECT_PATTERNS:
-        if pattern.search(text):
-            user_score += 1
+    # Each score counts the distinct patterns that match, so the patterns
+    # are only searched when a prefilter hint shows one of them could hit.
+    folded = text.translate(_ASCII_FOLD).lower()
+
+    if any(hint in folded for hint in _USER_SUBJECT_HINTS):
+        user_score = sum(1 for pattern in _USER_SUBJECT_PATTERNS if pattern.search(text))
 
-    for pattern in _PROJECT_SUBJECT_PATTERNS:
-        if pattern.search(text):
-            project_score += 1
+    if any(hint in folded for hint in _PROJECT_SUBJECT_HINTS) or _ISO_DATE.search(text):
+        project_score = sum(1 for pattern in _PROJECT_SUBJECT_PATTERNS if pattern.search(text))
 
     # Dynamic project-name pattern.
-    if project_name and len(project_name) >= 3:
-        name_pat = re.compile(rf"\b{re.escape(project_name)}\b", re.IGNORECASE)
-        if name_pat.search(text):
-            project_score += 2  # strong signal
+    if project_name and len(project_name) >= 3 and _project_name_pattern(project_name).search(text):
+        project_score += 2  # strong signal
 
     # Only override when there is a clear winner.
     if user_score > 0 and user_score > project_score:
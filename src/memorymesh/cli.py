@@ -342,11 +342,26 @@ def _cmd_export(args: argparse.Namespace) -> int:
     scope = _resolve_scope(args.scope)
     memories = mesh.list(limit=100_000, scope=scope)
 
+    content = ""
     if args.format == "json":
         output = [_memory_to_dict(m) for m in memories]
-        content = json.dumps(output, indent=2, ensure_ascii=False)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(output, f, indent=2, ensure_ascii=False)
+        else:
+            content = json.dumps(output, indent=2, ensure_ascii=False)
+    elif args.output:
+        # HTML export to a file is streamed rather than built in memory.
+        from .html_export import generate_html_to_file
+
+        generate_html_to_file(
+            args.output,
+            memories=memories,
+            title="MemoryMesh Export",
+            project_path=mesh.project_path,
+            global_path=mesh.global_path,
+        )
     else:
-        # HTML export
         from .html_export import generate_html
 
         content = generate_html(
@@ -359,8 +374,6 @@ def _cmd_export(args: argparse.Namespace) -> int:
     mesh.close()
 
     if args.output:
-        with open(args.output, "w", encoding="utf-8") as f:
-            f.write(content)
         print(f"Exported {len(memories)} memories to {args.output}")
     else:
         print(content)
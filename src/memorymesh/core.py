@@ -7,8 +7,11 @@ three-method API: :meth:`remember`, :meth:`recall`, :meth:`forget`.
 from __future__ import annotations
 
 import builtins
+import contextlib
+import itertools
 import logging
 import os
+from collections.abc import Iterable, Iterator, Sequence
 from typing import Any
 
 from .auto_importance import score_importance
@@ -26,6 +29,9 @@ from .store import _DEFAULT_GLOBAL_DB, MemoryStore, migrate_legacy_db
 
 logger = logging.getLogger(__name__)
 
+# Importance added to same-session memories while ranking a recall.
+_SESSION_BOOST = 0.15
+
 
 class MemoryMesh:
     """The SQLite of AI Memory.
@@ -50,9 +56,10 @@ class MemoryMesh:
 
     Args:
         path: Path to the project SQLite database file, or ``None`` for
-            global-only mode.
+            global-only mode.  ``":memory:"`` selects an ephemeral
+            in-memory database.
         global_path: Path to the global SQLite database file.  Defaults
-            to ``~/.memorymesh/global.db``.
+            to ``~/.memorymesh/global.db``.  Also accepts ``":memory:"``.
         embedding: Embedding provider to use.  Accepts a string name
             (``"local"``, ``"ollama"``, ``"openai"``, ``"none"``) or an
             :class:`EmbeddingProvider` instance for full control.
@@ -354,6 +361,34 @@ class MemoryMesh:
 
         return memory.id
 
+    def remember_many(self, items: Iterable[dict[str, Any]]) -> builtins.list[str]:
+        """Store several memories, committing each store only once.
+
+        Each item holds the keyword arguments for one :meth:`remember`
+        call and is processed exactly as :meth:`remember` would, including
+        deduplication and contradiction detection against the memories
+        stored before it.  All writes are grouped into one transaction per
+        store, so a failing item rolls back the whole batch.
+
+        Args:
+            items: Mappings of :meth:`remember` keyword arguments, e.g.
+                ``{"text": "Uses SQLite", "importance": 0.8}``.
+
+        Returns:
+            The IDs returned by :meth:`remember`, in input order.
+
+        Raises:
+            RuntimeError: If an item targets the project scope but no
+                project database is configured.
+            ValueError: If an item has an invalid category or
+                *on_conflict* value.
+        """
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(self._global_store.transaction())
+            if self._project_store is not None:
+                stack.enter_context(self._project_store.transaction())
+            return [self.remember(**item) for item in items]
+
     def recall(
         self,
         query: str,
@@ -446,13 +481,7 @@ class MemoryMesh:
         self._engine.apply_decay(candidates)
 
         # Boost same-session memories by temporarily increasing importance.
-        session_boost = 0.15
-        boosted_ids: set[str] = set()
-        if session_id:
-            for mem in candidates:
-                if mem.session_id == session_id:
-                    mem.importance = min(1.0, mem.importance + session_boost)
-                    boosted_ids.add(mem.id)
+        original_importance = self._apply_session_boost(candidates, session_id)
 
         # Rank and return top-k.
         results = self._engine.rank(
@@ -464,8 +493,8 @@ class MemoryMesh:
 
         # Restore boosted importance so the persisted value is unchanged.
         for mem in results:
-            if mem.id in boosted_ids:
-                mem.importance = max(0.0, mem.importance - session_boost)
+            if mem.id in original_importance:
+                mem.importance = original_importance[mem.id]
 
         # Update access counts for returned memories (batched per store).
         project_ids = [m.id for m in results if m.scope != GLOBAL_SCOPE]
@@ -557,6 +586,38 @@ class MemoryMesh:
             total += self._project_store.count()
         return total
 
+    def iter_memories(
+        self,
+        columns: Sequence[str],
+        scope: str | None = None,
+    ) -> Iterator[tuple[Any, ...]]:
+        """Stream selected scalar fields of every memory.
+
+        Unlike :meth:`list`, no :class:`Memory` objects are built and no
+        page of results is held in memory, which suits aggregate passes
+        such as collecting importance scores.
+
+        Args:
+            columns: Column names to select, e.g. ``("id", "importance")``.
+                See :meth:`MemoryStore.iter_columns` for the allowed names.
+            scope: ``"project"``, ``"global"``, or ``None`` (default) for
+                both stores, project first.
+
+        Returns:
+            An iterator of one tuple per memory, in *columns* order, most
+            recently updated first within each store.
+
+        Raises:
+            ValueError: If a column cannot be selected.
+        """
+        # Every store call validates *columns* before anything is fetched.
+        iterators: builtins.list[Iterator[tuple[Any, ...]]] = []
+        if scope != GLOBAL_SCOPE and self._project_store:
+            iterators.append(self._project_store.iter_columns(columns))
+        if scope != PROJECT_SCOPE:
+            iterators.append(self._global_store.iter_columns(columns))
+        return itertools.chain.from_iterable(iterators)
+
     def list(
         self,
         limit: int = 10,
@@ -1262,6 +1323,30 @@ class MemoryMesh:
                 candidates.append(hit)
         return candidates
 
+    @staticmethod
+    def _apply_session_boost(
+        candidates: builtins.list[Memory],
+        session_id: str | None,
+    ) -> dict[str, float]:
+        """Temporarily raise the importance of same-session candidates.
+
+        Args:
+            candidates: Memories about to be ranked.  Modified in place.
+            session_id: The caller's session, or ``None`` for no boost.
+
+        Returns:
+            The original importance of every boosted memory, keyed by ID,
+            so the caller can restore it after ranking.
+        """
+        original: dict[str, float] = {}
+        if not session_id:
+            return original
+        for mem in candidates:
+            if mem.session_id == session_id:
+                original[mem.id] = mem.importance
+                mem.importance = min(1.0, mem.importance + _SESSION_BOOST)
+        return original
+
     @staticmethod
     def _build_embedder(name: str, **kwargs: Any) -> EmbeddingProvider:
         """Translate user-friendly kwargs to provider-specific ones."""
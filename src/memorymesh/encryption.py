@@ -28,6 +28,8 @@ import json
 import os
 import sqlite3
 import struct
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import AbstractContextManager
 from typing import Any
 
 from .memory import Memory
@@ -292,7 +294,26 @@ class EncryptedMemoryStore:
         Args:
             memory: The :class:`Memory` to persist.
         """
-        encrypted_mem = Memory(
+        self._store.save(self._encrypt_memory(memory))
+
+    def save_many(self, memories: Iterable[Memory]) -> None:
+        """Encrypt and persist several memories in a single transaction.
+
+        Args:
+            memories: The :class:`Memory` objects to persist.
+        """
+        self._store.save_many(self._encrypt_memory(m) for m in memories)
+
+    def _encrypt_memory(self, memory: Memory) -> Memory:
+        """Return a copy of *memory* with ``text`` and ``metadata`` encrypted.
+
+        Args:
+            memory: The plaintext :class:`Memory`.
+
+        Returns:
+            A new :class:`Memory` ready to be written to the wrapped store.
+        """
+        return Memory(
             id=memory.id,
             text=encrypt_field(memory.text, self._key),
             metadata={
@@ -309,7 +330,6 @@ class EncryptedMemoryStore:
             session_id=memory.session_id,
             scope=memory.scope,
         )
-        self._store.save(encrypted_mem)
 
     # -- Read operations (decrypt after retrieval) ------------------------
 
@@ -592,6 +612,14 @@ class EncryptedMemoryStore:
         """
         return self._store.list_sessions(limit=limit)
 
+    def iter_columns(self, columns: Sequence[str]) -> Iterator[tuple[Any, ...]]:
+        """Yield selected scalar columns for every memory.
+
+        Only plaintext columns can be selected, so this is a direct
+        delegation.  See :meth:`MemoryStore.iter_columns`.
+        """
+        return self._store.iter_columns(columns)
+
     def count(self) -> int:
         """Return the total number of stored memories."""
         return self._store.count()
@@ -622,6 +650,13 @@ class EncryptedMemoryStore:
         """
         self._store.update_access(memory_id)
 
+    def transaction(self) -> AbstractContextManager[None]:
+        """Group several store calls into a single transaction.
+
+        See :meth:`MemoryStore.transaction`.
+        """
+        return self._store.transaction()
+
     def close(self) -> None:
         """Close the underlying store."""
         self._store.close()
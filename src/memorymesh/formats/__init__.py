@@ -23,7 +23,7 @@ import logging
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
-from ._shared import is_duplicate
+from ._shared import build_duplicate_index, is_duplicate_indexed, normalise
 
 if TYPE_CHECKING:
     from ..core import MemoryMesh
@@ -41,6 +41,9 @@ class FormatAdapter(ABC):
 
     Each adapter knows how to export MemoryMesh memories to, and import
     from, a specific AI tool's markdown format.
+
+    Adapters must be stateless: the registry creates one instance per
+    format and hands that same instance to every caller.
     """
 
     @property
@@ -143,6 +146,7 @@ class FormatAdapter(ABC):
 # ---------------------------------------------------------------------------
 
 _REGISTRY: dict[str, type[FormatAdapter]] = {}
+_INSTANCES: dict[str, FormatAdapter] = {}
 _ALL_LOADED = False
 
 
@@ -161,22 +165,23 @@ def register_format(cls: type[FormatAdapter]) -> type[FormatAdapter]:
     Returns:
         The class unchanged (for use as a decorator).
     """
-    # Instantiate temporarily to read the name property.
-    # All adapters should be lightweight to construct.
+    # Adapters are stateless, so the instance used to read the name is
+    # kept and shared by every later lookup.
     instance = cls()
     adapter_name: str = instance.name
     _REGISTRY[adapter_name] = cls
+    _INSTANCES[adapter_name] = instance
     return cls
 
 
 def create_format_adapter(name: str) -> FormatAdapter:
-    """Create a format adapter by name.
+    """Return the format adapter registered under *name*.
 
     Args:
         name: The adapter name (e.g. ``"claude"``, ``"codex"``, ``"gemini"``).
 
     Returns:
-        A new adapter instance.
+        The shared adapter instance for that format.
 
     Raises:
         ValueError: If the name is not registered.
@@ -185,17 +190,17 @@ def create_format_adapter(name: str) -> FormatAdapter:
     if name not in _REGISTRY:
         available = ", ".join(sorted(_REGISTRY.keys()))
         raise ValueError(f"Unknown format {name!r}. Available: {available}")
-    return _REGISTRY[name]()
+    return _INSTANCES[name]
 
 
 def get_all_adapters() -> list[FormatAdapter]:
-    """Return instances of all registered format adapters.
+    """Return the shared instances of all registered format adapters.
 
     Returns:
-        A list of adapter instances, sorted by name.
+        A new list of adapter instances, sorted by class name.
     """
     _ensure_adapters_loaded()
-    return [cls() for cls in sorted(_REGISTRY.values(), key=lambda c: c.__name__)]
+    return sorted(_INSTANCES.values(), key=lambda a: type(a).__name__)
 
 
 def get_installed_adapters() -> list[FormatAdapter]:
@@ -288,10 +293,13 @@ def sync_from_format(
     if not entries:
         return 0
 
-    imported = 0
+    # Normalise every existing memory in the scope once, rather than
+    # recalling and re-normalising candidates for each entry.
+    seen = build_duplicate_index(mesh.list(limit=mesh.count(scope=scope), scope=scope))
+
+    batch: list[dict[str, Any]] = []
     for text, importance, metadata in entries:
-        existing = mesh.recall(query=text, k=5, scope=scope)
-        if is_duplicate(text, existing):
+        if is_duplicate_indexed(text, seen):
             logger.debug("Skipping duplicate: %.60s...", text)
             continue
 
@@ -299,13 +307,12 @@ def sync_from_format(
         meta = {"source": adapter.name, "imported": True}
         meta.update(metadata)
 
-        mesh.remember(
-            text=text,
-            metadata=meta,
-            importance=importance,
-            scope=scope,
-        )
-        imported += 1
+        batch.append({"text": text, "metadata": meta, "importance": importance, "scope": scope})
+        seen.add(normalise(text))
+
+    # One transaction for the whole file instead of a commit per entry.
+    mesh.remember_many(batch)
+    imported = len(batch)
 
     logger.info(
         "Imported %d memories from %s (adapter=%s, scope=%s)",
@@ -9,6 +9,7 @@ Uses **only the Python standard library** -- no external dependencies.
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -61,6 +62,36 @@ def is_duplicate(text: str, candidates: list[Memory]) -> bool:
     return any(normalise(mem.text) == normalised for mem in candidates)
 
 
+def build_duplicate_index(candidates: Iterable[Memory]) -> set[str]:
+    """Normalise the text of *candidates* once for repeated lookups.
+
+    Importers that check many entries against the same memories should
+    build this index up front and query it with
+    :func:`is_duplicate_indexed` instead of calling :func:`is_duplicate`
+    per entry.
+
+    Args:
+        candidates: Existing memories to compare against.
+
+    Returns:
+        A set of normalised texts.  Callers may add to it as they import.
+    """
+    return {normalise(mem.text) for mem in candidates}
+
+
+def is_duplicate_indexed(text: str, index: set[str]) -> bool:
+    """Check *text* against an index from :func:`build_duplicate_index`.
+
+    Args:
+        text: The text to check.
+        index: Normalised texts of existing memories.
+
+    Returns:
+        ``True`` if a duplicate is found.
+    """
+    return normalise(text) in index
+
+
 # ---------------------------------------------------------------------------
 # Importance grouping
 # ---------------------------------------------------------------------------
@@ -191,7 +222,8 @@ def parse_importance_from_html_comment(line: str) -> tuple[str, float]:
     Returns:
         A ``(clean_line, importance)`` tuple.
     """
-    match = _HTML_COMMENT_IMPORTANCE.search(line)
+    # Most lines carry no comment at all; skip the regex for them.
+    match = _HTML_COMMENT_IMPORTANCE.search(line) if "<!--" in line else None
     if match:
         try:
             importance = max(0.0, min(1.0, float(match.group(1))))
@@ -212,7 +244,7 @@ def parse_importance_prefix(content: str) -> tuple[str, float]:
     Returns:
         A ``(clean_text, importance)`` tuple.
     """
-    match = _IMPORTANCE_PREFIX.match(content)
+    match = _IMPORTANCE_PREFIX.match(content) if content.startswith("[importance:") else None
     if match:
         try:
             importance = max(0.0, min(1.0, float(match.group(1))))
@@ -228,6 +260,9 @@ def parse_importance_prefix(content: str) -> tuple[str, float]:
 
 _SECTION_HEADING = "## MemoryMesh Synced Memories"
 
+_NEXT_HEADINGS = ("\n## ", "\n\n# ")
+"""Substrings marking the next level-2 or level-1 heading after the section."""
+
 
 def inject_section(existing_content: str, section_content: str) -> str:
     """Replace or insert the MemoryMesh section in an existing file.
@@ -249,10 +284,12 @@ def inject_section(existing_content: str, section_content: str) -> str:
         start = existing_content.index(heading)
 
         # Find the end: next heading of same or higher level, or EOF.
-        rest = existing_content[start + len(heading) :]
-        # Look for the next ## heading (same level or higher).
-        next_heading = re.search(r"\n(?=## |\n# )", rest)
-        end = start + len(heading) + next_heading.start() if next_heading else len(existing_content)
+        # Plain substring scans keep this linear on large files.
+        end = len(existing_content)
+        for marker in _NEXT_HEADINGS:
+            found = existing_content.find(marker, start + len(heading), end)
+            if found >= 0:
+                end = found
 
         # Reconstruct: before + new section + after
         before = existing_content[:start].rstrip()
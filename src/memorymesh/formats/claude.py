@@ -174,25 +174,24 @@ class ClaudeAdapter(FormatAdapter):
         if not os.path.isfile(input_path):
             raise FileNotFoundError(f"MEMORY.md not found: {input_path}")
 
-        with open(input_path, encoding="utf-8") as f:
-            raw_lines = f.readlines()
-
         entries: list[tuple[str, float, dict[str, Any]]] = []
 
-        for raw_line in raw_lines:
-            line = raw_line.strip()
-            if not line or line.startswith("#") or line.startswith(">"):
-                continue
-            if not line.startswith("- "):
-                continue
-
-            content = line[2:].strip()
-            if not content:
-                continue
-
-            text, importance = parse_importance_prefix(content)
-            if text:
-                entries.append((text, importance, {}))
+        # Stream the file line by line rather than materialising it.
+        with open(input_path, encoding="utf-8") as f:
+            for raw_line in f:
+                line = raw_line.strip()
+                if not line or line.startswith("#") or line.startswith(">"):
+                    continue
+                if not line.startswith("- "):
+                    continue
+
+                content = line[2:].strip()
+                if not content:
+                    continue
+
+                text, importance = parse_importance_prefix(content)
+                if text:
+                    entries.append((text, importance, {}))
 
         return entries
 
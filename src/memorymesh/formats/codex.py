@@ -9,6 +9,7 @@ user-authored content is preserved.
 from __future__ import annotations
 
 import os
+import re
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
@@ -30,6 +31,9 @@ if TYPE_CHECKING:
 
 _SECTION_HEADING = "## MemoryMesh Synced Memories"
 
+_BULLET_LINE = re.compile(r"^[^\S\n]*- [^\S\n]*(.*\S)[^\S\n]*$", re.MULTILINE)
+"""Regex matching a non-empty ``- `` bullet line, capturing its content."""
+
 
 # ---------------------------------------------------------------------------
 # Adapter
@@ -130,7 +134,7 @@ class CodexAdapter(FormatAdapter):
         parent = os.path.dirname(output_path)
         if parent:
             os.makedirs(parent, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
+        with open(output_path, "w", encoding="utf-8", newline="\n") as f:
             f.write(result)
 
         return sum(1 for line in section_lines if line.startswith("- "))
@@ -157,24 +161,13 @@ class CodexAdapter(FormatAdapter):
             raise FileNotFoundError(f"AGENTS.md not found: {input_path}")
 
         with open(input_path, encoding="utf-8") as f:
-            raw_lines = f.readlines()
+            content = f.read()
 
+        # Headings, quotes, comments and prose are skipped inside the
+        # regex engine; only bullet lines reach the Python loop.
         entries: list[tuple[str, float, dict[str, Any]]] = []
-
-        for raw_line in raw_lines:
-            line = raw_line.strip()
-            if not line or line.startswith("#") or line.startswith(">"):
-                continue
-            if line.startswith("<!--") and line.endswith("-->"):
-                continue
-            if not line.startswith("- "):
-                continue
-
-            content = line[2:].strip()
-            if not content:
-                continue
-
-            text, importance = parse_importance_from_html_comment(content)
+        for match in _BULLET_LINE.finditer(content):
+            text, importance = parse_importance_from_html_comment(match.group(1))
             if text:
                 entries.append((text, importance, {}))
 
@@ -214,7 +207,7 @@ class CodexAdapter(FormatAdapter):
         else:
             result = f"# AGENTS.md\n\n{section}"
 
-        with open(agents_path, "w", encoding="utf-8") as f:
+        with open(agents_path, "w", encoding="utf-8", newline="\n") as f:
             f.write(result)
 
         messages.append(f"Created/updated {agents_path} with MemoryMesh section")
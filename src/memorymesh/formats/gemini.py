@@ -12,6 +12,7 @@ during import.
 from __future__ import annotations
 
 import os
+import re
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
@@ -34,6 +35,11 @@ if TYPE_CHECKING:
 _SECTION_HEADING = "## MemoryMesh Synced Memories"
 _GEMINI_AUTO_SECTION = "## Gemini Added Memories"
 
+_HEADING_OR_BULLET_LINE = re.compile(
+    r"^[^\S\n]*(?:(## .*\S)|- [^\S\n]*(.*\S))[^\S\n]*$", re.MULTILINE
+)
+"""Regex matching a level-2 heading (group 1) or a non-empty bullet (group 2)."""
+
 
 # ---------------------------------------------------------------------------
 # Adapter
@@ -134,7 +140,7 @@ class GeminiAdapter(FormatAdapter):
         parent = os.path.dirname(output_path)
         if parent:
             os.makedirs(parent, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
+        with open(output_path, "w", encoding="utf-8", newline="\n") as f:
             f.write(result)
 
         return sum(1 for line in section_lines if line.startswith("- "))
@@ -162,34 +168,22 @@ class GeminiAdapter(FormatAdapter):
             raise FileNotFoundError(f"GEMINI.md not found: {input_path}")
 
         with open(input_path, encoding="utf-8") as f:
-            raw_lines = f.readlines()
+            content = f.read()
 
         entries: list[tuple[str, float, dict[str, Any]]] = []
         in_gemini_section = False
 
-        for raw_line in raw_lines:
-            line = raw_line.strip()
+        # Only level-2 headings and bullet lines reach the Python loop;
+        # everything else is skipped inside the regex engine.
+        for match in _HEADING_OR_BULLET_LINE.finditer(content):
+            heading, bullet = match.groups()
 
             # Track Gemini auto-section for metadata tagging.
-            if line == _GEMINI_AUTO_SECTION:
-                in_gemini_section = True
-                continue
-            elif line.startswith("## "):
-                in_gemini_section = False
-                continue
-
-            if not line or line.startswith("#") or line.startswith(">"):
-                continue
-            if line.startswith("<!--") and line.endswith("-->"):
-                continue
-            if not line.startswith("- "):
-                continue
-
-            content = line[2:].strip()
-            if not content:
+            if heading is not None:
+                in_gemini_section = heading == _GEMINI_AUTO_SECTION
                 continue
 
-            text, importance = parse_importance_from_html_comment(content)
+            text, importance = parse_importance_from_html_comment(bullet)
             metadata: dict[str, Any] = {}
             if in_gemini_section:
                 metadata["gemini_auto"] = True
@@ -233,7 +227,7 @@ class GeminiAdapter(FormatAdapter):
         else:
             result = f"# GEMINI.md\n\n{section}"
 
-        with open(gemini_path, "w", encoding="utf-8") as f:
+        with open(gemini_path, "w", encoding="utf-8", newline="\n") as f:
             f.write(result)
 
         messages.append(f"Created/updated {gemini_path} with MemoryMesh section")
@@ -20,7 +20,11 @@ Usage::
 
 from __future__ import annotations
 
+import functools
 import html
+import io
+from collections import Counter
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
@@ -39,6 +43,37 @@ def _escape(text: str) -> str:
     return html.escape(text, quote=True)
 
 
+def _escape_text(text: str) -> str:
+    """HTML-escape text placed in element content, never in an attribute.
+
+    Quotes are harmless outside attributes, so only ``&``, ``<`` and
+    ``>`` are replaced.
+
+    Args:
+        text: Raw text.
+
+    Returns:
+        HTML-safe string for element content.
+    """
+    return html.escape(text, quote=False)
+
+
+@functools.lru_cache(maxsize=512)
+def _escape_key(key: str) -> str:
+    """Cached :func:`_escape` for short strings that repeat across cards.
+
+    Metadata keys and scope names come from a small vocabulary, so each
+    distinct value is escaped only once per process.
+
+    Args:
+        key: Raw key.
+
+    Returns:
+        HTML-safe string.
+    """
+    return _escape(key)
+
+
 def _format_timestamp(dt: datetime) -> str:
     """Format a datetime to ``YYYY-MM-DD HH:MM``.
 
@@ -80,48 +115,63 @@ def _metadata_html(metadata: dict[str, Any]) -> str:
     """
     if not metadata:
         return ""
-    items = []
-    for k, v in metadata.items():
-        items.append(
-            f'<span class="meta-key">{_escape(str(k))}</span>='
-            f'<span class="meta-val">{_escape(str(v))}</span>'
-        )
-    return '<div class="meta">' + " &middot; ".join(items) + "</div>"
+    items = " &middot; ".join(_metadata_item(k, v) for k, v in metadata.items())
+    return f'<div class="meta">{items}</div>'
 
 
-def _memory_card(mem: Memory) -> str:
-    """Render a single memory as an HTML card.
+def _metadata_item(key: Any, value: Any) -> str:
+    """Render one metadata ``key=value`` pair.
 
     Args:
-        mem: The memory to render.
+        key: Metadata key.
+        value: Metadata value.
 
     Returns:
-        HTML string for the memory card.
+        HTML string for the pair.
+    """
+    return (
+        f'<span class="meta-key">{_escape_key(str(key))}</span>='
+        f'<span class="meta-val">{_escape(str(value))}</span>'
+    )
+
+
+def _write_memory_card(write: Callable[[str], object], mem: Memory) -> None:
+    """Write the HTML for one memory card.
+
+    Args:
+        write: Sink receiving the card markup, e.g. ``stream.write``.
+        mem: The memory to render.
     """
     scope_class = "scope-project" if mem.scope == "project" else "scope-global"
+    scope = _escape_key(mem.scope)
     emb = mem.embedding
-    has_emb = emb is not None and len(emb) > 0
-    emb_badge = f' <span class="badge">emb:{len(emb)}d</span>' if has_emb and emb else ""
-
-    return f"""<div class="card" data-scope="{_escape(mem.scope)}" data-text="{_escape(mem.text.lower())}">
-  <div class="card-header">
-    <span class="badge {scope_class}">{_escape(mem.scope)}</span>
-    <code class="mem-id">{_escape(mem.id[:8])}</code>
-    {emb_badge}
-    <span class="hits">{mem.access_count}x</span>
-  </div>
-  <div class="card-body">
-    <pre class="mem-text">{_escape(mem.text)}</pre>
-  </div>
-  <div class="card-footer">
-    {_importance_bar(mem.importance)}
-    {_metadata_html(mem.metadata)}
-    <div class="timestamps">
-      Created: {_format_timestamp(mem.created_at)} &middot;
-      Updated: {_format_timestamp(mem.updated_at)}
-    </div>
-  </div>
-</div>"""
+    emb_badge = f' <span class="badge">emb:{len(emb)}d</span>' if emb else ""
+
+    write(
+        "".join(
+            (
+                f'<div class="card" data-scope="{scope}" data-text="{_escape(mem.text.lower())}">\n',
+                '  <div class="card-header">\n',
+                f'    <span class="badge {scope_class}">{scope}</span>\n',
+                f'    <code class="mem-id">{_escape(mem.id[:8])}</code>\n',
+                f"    {emb_badge}\n",
+                f'    <span class="hits">{mem.access_count}x</span>\n',
+                "  </div>\n",
+                '  <div class="card-body">\n',
+                f'    <pre class="mem-text">{_escape_text(mem.text)}</pre>\n',
+                "  </div>\n",
+                '  <div class="card-footer">\n',
+                f"    {_importance_bar(mem.importance)}\n",
+                f"    {_metadata_html(mem.metadata)}\n",
+                '    <div class="timestamps">\n',
+                f"      Created: {_format_timestamp(mem.created_at)} &middot;\n",
+                f"      Updated: {_format_timestamp(mem.updated_at)}\n",
+                "    </div>\n",
+                "  </div>\n",
+                "</div>",
+            )
+        )
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -344,6 +394,98 @@ _JS = """
 """
 
 
+# ---------------------------------------------------------------------------
+# Page skeleton
+# ---------------------------------------------------------------------------
+
+_HTML_HEAD_PREFIX = (
+    "<!DOCTYPE html>\n"
+    '<html lang="en">\n'
+    "<head>\n"
+    '<meta charset="UTF-8">\n'
+    '<meta name="viewport" content="width=device-width, initial-scale=1.0">\n'
+    "<title>"
+)
+"""Static markup up to the page title."""
+
+_HTML_HEAD_SUFFIX = "</title>\n<style>" + _CSS + "</style>\n</head>\n<body>\n<h1>"
+"""Static markup between the page title and the heading text."""
+
+_HTML_TAIL = "\n\n<script>" + _JS + "</script>\n</body>\n</html>"
+"""Static markup after the last memory card."""
+
+
+# ---------------------------------------------------------------------------
+# Rendering
+# ---------------------------------------------------------------------------
+
+
+def _write_html(
+    write: Callable[[str], object],
+    memories: list[Memory],
+    title: str,
+    project_path: str | None,
+    global_path: str | None,
+) -> None:
+    """Stream the export page to *write* one fragment at a time.
+
+    Args:
+        write: Sink receiving successive pieces of markup.
+        memories: Memories to display.
+        title: Page title.
+        project_path: Path to the project database (for display only).
+        global_path: Path to the global database (for display only).
+    """
+    # Count by scope in a single pass.
+    scope_counts = Counter(m.scope for m in memories)
+    proj_count = scope_counts["project"]
+    glob_count = scope_counts["global"]
+    total = len(memories)
+
+    # Subtitle
+    paths_info = []
+    if project_path:
+        paths_info.append(f"Project: {_escape(project_path)}")
+    if global_path:
+        paths_info.append(f"Global: {_escape(global_path)}")
+    subtitle = " &middot; ".join(paths_info) if paths_info else ""
+
+    escaped_title = _escape(title)
+    write(
+        "".join(
+            (
+                _HTML_HEAD_PREFIX,
+                escaped_title,
+                _HTML_HEAD_SUFFIX,
+                escaped_title,
+                "</h1>\n",
+                f'<div class="subtitle">{subtitle}</div>\n',
+                "\n",
+                '<div class="controls">\n',
+                '  <input type="text" id="search" class="search-box" placeholder="Search memories...">\n',
+                f'  <button class="filter-btn active" data-scope="all">All ({total})</button>\n',
+                f'  <button class="filter-btn" data-scope="project">Project ({proj_count})</button>\n',
+                f'  <button class="filter-btn" data-scope="global">Global ({glob_count})</button>\n',
+                "</div>\n",
+                "\n",
+                f'<div id="count" class="count">Showing {total} of {total} memories</div>\n',
+                "\n",
+            )
+        )
+    )
+
+    # Memory cards, separated by newlines.
+    if memories:
+        for i, mem in enumerate(memories):
+            if i:
+                write("\n")
+            _write_memory_card(write, mem)
+    else:
+        write('<div class="no-results">No memories stored yet.</div>')
+
+    write(_HTML_TAIL)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -369,47 +511,29 @@ def generate_html(
     Returns:
         A complete HTML document as a string.
     """
-    # Count by scope
-    proj_count = sum(1 for m in memories if m.scope == "project")
-    glob_count = sum(1 for m in memories if m.scope == "global")
-    total = len(memories)
+    buf = io.StringIO()
+    _write_html(buf.write, memories, title, project_path, global_path)
+    return buf.getvalue()
 
-    # Subtitle
-    paths_info = []
-    if project_path:
-        paths_info.append(f"Project: {_escape(project_path)}")
-    if global_path:
-        paths_info.append(f"Global: {_escape(global_path)}")
-    subtitle = " &middot; ".join(paths_info) if paths_info else ""
 
-    # Build memory cards
-    cards_html = "\n".join(_memory_card(m) for m in memories)
-    if not memories:
-        cards_html = '<div class="no-results">No memories stored yet.</div>'
-
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>{_escape(title)}</title>
-<style>{_CSS}</style>
-</head>
-<body>
-<h1>{_escape(title)}</h1>
-<div class="subtitle">{subtitle}</div>
-
-<div class="controls">
-  <input type="text" id="search" class="search-box" placeholder="Search memories...">
-  <button class="filter-btn active" data-scope="all">All ({total})</button>
-  <button class="filter-btn" data-scope="project">Project ({proj_count})</button>
-  <button class="filter-btn" data-scope="global">Global ({glob_count})</button>
-</div>
-
-<div id="count" class="count">Showing {total} of {total} memories</div>
-
-{cards_html}
-
-<script>{_JS}</script>
-</body>
-</html>"""
+def generate_html_to_file(
+    path: str,
+    memories: list[Memory],
+    title: str = "MemoryMesh Export",
+    project_path: str | None = None,
+    global_path: str | None = None,
+) -> None:
+    """Write the page produced by :func:`generate_html` straight to *path*.
+
+    Markup is streamed into the file as it is rendered, so large exports
+    never hold the whole document in memory.
+
+    Args:
+        path: Destination file, overwritten if it exists.
+        memories: List of :class:`Memory` objects to display.
+        title: Page title.
+        project_path: Path to the project database (for display only).
+        global_path: Path to the global database (for display only).
+    """
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        _write_html(f.write, memories, title, project_path, global_path)
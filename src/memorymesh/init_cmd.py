@@ -16,6 +16,7 @@ import contextlib
 import json
 import os
 import sys
+from typing import Any
 
 from .store import detect_project_root
 
@@ -90,25 +91,46 @@ def _ensure_memorymesh_dir(project_root: str) -> bool:
     return True
 
 
-def _configure_claude_mcp() -> str:
+def _load_settings(path: str) -> dict[str, Any]:
+    """Load a JSON settings file.
+
+    Args:
+        path: Path to an existing settings file.
+
+    Returns:
+        The parsed settings.
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON.
+        OSError: If the file cannot be read.
+    """
+    with open(path, encoding="utf-8") as f:
+        config: dict[str, Any] = json.load(f)
+    return config
+
+
+def _configure_claude_mcp(home_dir: str | None = None) -> str:
     """Write or update the Claude Code MCP config to include memorymesh.
 
     The config file is located at ``~/.claude/settings.json``.
     If the file exists, the memorymesh server entry is merged without
     destroying other server entries.
 
+    Args:
+        home_dir: Home directory containing ``.claude/``.  Defaults to
+            the current user's home directory.
+
     Returns:
         A status message describing what was done.
     """
-    config_dir = os.path.join(os.path.expanduser("~"), ".claude")
+    config_dir = os.path.join(home_dir or os.path.expanduser("~"), ".claude")
     config_path = os.path.join(config_dir, "settings.json")
 
     # Load existing config or start fresh.
     config: dict = {}
     if os.path.isfile(config_path):
         try:
-            with open(config_path, encoding="utf-8") as f:
-                config = json.load(f)
+            config = _load_settings(config_path)
         except (json.JSONDecodeError, OSError):
             # If the file is corrupted, preserve a backup and start fresh.
             backup_path = config_path + ".bak"
@@ -156,29 +178,30 @@ def _inject_claude_md(project_root: str) -> str:
     """
     claude_md_path = os.path.join(project_root, "CLAUDE.md")
 
-    if os.path.isfile(claude_md_path):
-        try:
-            with open(claude_md_path, encoding="utf-8") as f:
-                content = f.read()
-        except OSError as e:
-            return f"  Error reading {claude_md_path}: {e}"
-
-        # Check if the section already exists.
-        if _CLAUDE_MD_SECTION_HEADING in content:
-            return f"  Memory section already present in {claude_md_path}"
-
-        # Append the section with a blank line separator.
-        separator = "\n" if content.endswith("\n") else "\n\n"
-        with open(claude_md_path, "a", encoding="utf-8") as f:
-            f.write(separator + _CLAUDE_MD_SECTION)
-
-        return f"  Appended memory section to {claude_md_path}"
-    else:
+    # Open directly rather than stat first; a missing file is the only
+    # case that needs creating.
+    try:
+        with open(claude_md_path, encoding="utf-8") as f:
+            content = f.read()
+    except FileNotFoundError:
         # Create CLAUDE.md with just the memory section.
         with open(claude_md_path, "w", encoding="utf-8") as f:
             f.write(_CLAUDE_MD_SECTION)
 
         return f"  Created {claude_md_path} with memory instructions"
+    except OSError as e:
+        return f"  Error reading {claude_md_path}: {e}"
+
+    # Check if the section already exists.
+    if _CLAUDE_MD_SECTION_HEADING in content:
+        return f"  Memory section already present in {claude_md_path}"
+
+    # Append the section with a blank line separator.
+    separator = "\n" if content.endswith("\n") else "\n\n"
+    with open(claude_md_path, "a", encoding="utf-8") as f:
+        f.write(separator + _CLAUDE_MD_SECTION)
+
+    return f"  Appended memory section to {claude_md_path}"
 
 
 # ---------------------------------------------------------------------------
@@ -191,6 +214,7 @@ def run_init(
     skip_mcp: bool = False,
     skip_claude_md: bool = False,
     only: str | None = None,
+    home_dir: str | None = None,
 ) -> int:
     """Run the ``memorymesh init`` command.
 
@@ -206,6 +230,8 @@ def run_init(
         skip_claude_md: If ``True``, skip CLAUDE.md injection.
         only: If set, only initialise this specific format adapter
             (``"claude"``, ``"codex"``, ``"gemini"``).
+        home_dir: Home directory holding the Claude Code settings.
+            Defaults to the current user's home directory.
 
     Returns:
         Exit code: ``0`` for success, ``1`` for errors.
@@ -261,7 +287,7 @@ def run_init(
         print("[~] Skipped MCP configuration (--skip-mcp)")
     else:
         print("[*] Claude Code MCP configuration:")
-        status = _configure_claude_mcp()
+        status = _configure_claude_mcp(home_dir)
         print(status)
 
     # 4. Inject CLAUDE.md section.
@@ -32,7 +32,7 @@ import json
 import logging
 import os
 import sys
-from typing import Any
+from typing import Any, TextIO
 
 from memorymesh import __version__
 
@@ -58,6 +58,10 @@ SERVER_INFO = {
     "version": __version__,
 }
 
+# json.dumps() builds a fresh encoder whenever it is given options, so the
+# stdout framing reuses one.  Compact separators keep each line short.
+_WIRE_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
 # ---------------------------------------------------------------------------
 # Security limits
 # ---------------------------------------------------------------------------
@@ -68,11 +72,23 @@ MAX_MESSAGE_SIZE = 1_000_000  # Maximum JSON-RPC message size (bytes)
 MAX_BATCH_SIZE = 50  # Maximum messages in a JSON-RPC batch
 MAX_MEMORY_COUNT = 100_000  # Maximum total memories allowed
 
+# Encodes metadata exactly as MemoryStore persists it, for the size check.
+_METADATA_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
+def _metadata_too_large(metadata: dict[str, Any]) -> bool:
+    """Return whether *metadata* serialises to more than :data:`MAX_METADATA_SIZE`.
+
+    An empty object always fits, so it is not serialised at all.
+    """
+    return bool(metadata) and len(_METADATA_ENCODER.encode(metadata)) > MAX_METADATA_SIZE
+
+
 # ---------------------------------------------------------------------------
 # Prompt and tool definitions
 # ---------------------------------------------------------------------------
 
-PROMPTS: list[dict[str, Any]] = [
+PROMPTS: tuple[dict[str, Any], ...] = (
     {
         "name": "memory-context",
         "description": (
@@ -89,9 +105,9 @@ PROMPTS: list[dict[str, Any]] = [
             }
         ],
     },
-]
+)
 
-TOOLS: list[dict[str, Any]] = [
+TOOLS: tuple[dict[str, Any], ...] = (
     {
         "name": "remember",
         "description": (
@@ -461,7 +477,40 @@ TOOLS: list[dict[str, Any]] = [
             "required": ["path"],
         },
     },
-]
+)
+
+# ---------------------------------------------------------------------------
+# Handler dispatch tables
+# ---------------------------------------------------------------------------
+
+# Built once at import and shared by every server instance.  Maps
+# method/tool names to attribute names for getattr-based dispatch, so that
+# test mocking (patch.object) still works correctly.
+_METHOD_HANDLERS: dict[str, str] = {
+    "initialize": "_handle_initialize",
+    "initialized": "_handle_initialized",
+    "ping": "_handle_ping",
+    "tools/list": "_handle_tools_list",
+    "tools/call": "_handle_tools_call",
+    "prompts/list": "_handle_prompts_list",
+    "prompts/get": "_handle_prompts_get",
+    "notifications/initialized": "_handle_initialized",
+}
+
+_TOOL_HANDLERS: dict[str, str] = {
+    "remember": "_tool_remember",
+    "recall": "_tool_recall",
+    "forget": "_tool_forget",
+    "forget_batch": "_tool_forget_batch",
+    "forget_all": "_tool_forget_all",
+    "memory_stats": "_tool_memory_stats",
+    "session_start": "_tool_session_start",
+    "update_memory": "_tool_update_memory",
+    "review_memories": "_tool_review_memories",
+    "cleanup": "_tool_cleanup",
+    "status": "_tool_status",
+    "configure_project": "_tool_configure_project",
+}
 
 # ---------------------------------------------------------------------------
 # MCP Server
@@ -477,45 +526,28 @@ class MemoryMeshMCPServer:
     Args:
         mesh: An existing :class:`MemoryMesh` instance to use. If ``None``,
             one will be created from environment variable configuration.
+        out: Stream that responses are written to.  If ``None``,
+            :data:`sys.stdout` is looked up at write time.
+        client_name: Name recorded as the ``tool`` provenance of new
+            memories until an ``initialize`` request supplies one.
     """
 
-    def __init__(self, mesh: MemoryMesh | None = None) -> None:
+    def __init__(
+        self,
+        mesh: MemoryMesh | None = None,
+        out: TextIO | None = None,
+        client_name: str = "unknown",
+    ) -> None:
         # Lazy initialization: if no mesh is provided, it will be created
         # in _handle_initialize when the client connects.  This avoids
-        # the old double-init pattern (create → close → recreate).
+        # the old double-init pattern (create → close → recreate).  A
+        # server given a ready-made mesh has nothing left to wait for.
         self._mesh: MemoryMesh | None = mesh
-        self._initialized = False
+        self._initialized = mesh is not None
         self._project_root: str | None = None
-        self._detection_diagnostics: list[str] = []
-        self._client_name: str = "unknown"
-
-        # Cached handler dispatch dicts -- built once, reused on every call.
-        # Maps method/tool names to attribute names for getattr-based dispatch,
-        # so that test mocking (patch.object) still works correctly.
-        self._method_handlers: dict[str, str] = {
-            "initialize": "_handle_initialize",
-            "initialized": "_handle_initialized",
-            "ping": "_handle_ping",
-            "tools/list": "_handle_tools_list",
-            "tools/call": "_handle_tools_call",
-            "prompts/list": "_handle_prompts_list",
-            "prompts/get": "_handle_prompts_get",
-            "notifications/initialized": "_handle_initialized",
-        }
-        self._tool_handlers: dict[str, str] = {
-            "remember": "_tool_remember",
-            "recall": "_tool_recall",
-            "forget": "_tool_forget",
-            "forget_batch": "_tool_forget_batch",
-            "forget_all": "_tool_forget_all",
-            "memory_stats": "_tool_memory_stats",
-            "session_start": "_tool_session_start",
-            "update_memory": "_tool_update_memory",
-            "review_memories": "_tool_review_memories",
-            "cleanup": "_tool_cleanup",
-            "status": "_tool_status",
-            "configure_project": "_tool_configure_project",
-        }
+        self._detection_diagnostics: tuple[str, ...] = ()
+        self._client_name = client_name
+        self._out = out
 
         logger.info("MemoryMeshMCPServer created (lazy init, mesh=%r)", self._mesh)
 
@@ -677,7 +709,7 @@ class MemoryMeshMCPServer:
             A callable ``(params) -> result``, or ``None`` if the method
             is not supported.
         """
-        attr_name = self._method_handlers.get(method)
+        attr_name = _METHOD_HANDLERS.get(method)
         if attr_name is None:
             return None
         return getattr(self, attr_name)
@@ -710,7 +742,8 @@ class MemoryMeshMCPServer:
         diagnostics: list[str] = []
         project_root = detect_project_root(roots, diagnostics=diagnostics)
         self._project_root = project_root
-        self._detection_diagnostics = diagnostics
+        # Frozen once detection is done; the status tool only reads it.
+        self._detection_diagnostics = tuple(diagnostics)
 
         # Close any pre-existing mesh (e.g. one passed to __init__ for testing).
         if self._mesh is not None:
@@ -804,7 +837,7 @@ class MemoryMeshMCPServer:
 
         logger.info("Tool call: %s (keys: %s)", tool_name, list(arguments.keys()))
 
-        attr_name = self._tool_handlers.get(tool_name)  # type: ignore[arg-type]
+        attr_name = _TOOL_HANDLERS.get(tool_name)  # type: ignore[arg-type]
         if attr_name is None:
             return self._tool_error(f"Unknown tool: {tool_name}")
 
@@ -934,8 +967,7 @@ class MemoryMeshMCPServer:
         if not isinstance(metadata, dict):
             return self._tool_error("'metadata' must be an object.")
 
-        meta_serialized = json.dumps(metadata, ensure_ascii=False)
-        if len(meta_serialized) > MAX_METADATA_SIZE:
+        if _metadata_too_large(metadata):
             return self._tool_error(
                 f"'metadata' exceeds maximum size of {MAX_METADATA_SIZE} bytes."
             )
@@ -944,15 +976,16 @@ class MemoryMeshMCPServer:
         if scope not in (PROJECT_SCOPE, GLOBAL_SCOPE):
             return self._tool_error("'scope' must be 'project' or 'global'.")
 
-        # Enforce total memory count limit.
-        if self._mesh.count() >= MAX_MEMORY_COUNT:
-            return self._tool_error(f"Memory limit reached ({MAX_MEMORY_COUNT} memories).")
-
         importance = args.get("importance", 0.5)
         if not isinstance(importance, (int, float)):
             return self._tool_error("'importance' must be a number.")
         importance = max(0.0, min(1.0, float(importance)))
 
+        # Enforce total memory count limit.  This queries both stores, so
+        # it runs only once the in-memory argument checks have passed.
+        if self._mesh.count() >= MAX_MEMORY_COUNT:
+            return self._tool_error(f"Memory limit reached ({MAX_MEMORY_COUNT} memories).")
+
         category = args.get("category")
         auto_categorize_flag = args.get("auto_categorize", False)
         pin = args.get("pin", False)
@@ -1181,6 +1214,20 @@ class MemoryMeshMCPServer:
         if project_context is not None and not isinstance(project_context, str):
             return self._tool_error("'project_context' must be a string.")
 
+        return self._tool_json(self._session_start_payload(project_context))
+
+    def _session_start_payload(self, project_context: str | None) -> dict[str, Any]:
+        """Build the ``session_start`` result as a plain dict.
+
+        Args:
+            project_context: Optional description of the current task.
+
+        Returns:
+            Structured session context with a ``store_health`` entry, or
+            an ``error`` entry if no mesh is available.
+        """
+        if self._mesh is None:
+            return {"error": "MemoryMesh not initialized. Call initialize first."}
         context = self._mesh.session_start(project_context=project_context)
 
         # Inject store health so the agent knows immediately if something
@@ -1198,8 +1245,7 @@ class MemoryMeshMCPServer:
                 "Use the 'configure_project' tool or set MEMORYMESH_PROJECT_ROOT."
             )
         context["store_health"] = store_health
-
-        return self._tool_success(json.dumps(context, indent=2))
+        return context
 
     def _tool_update_memory(self, args: dict[str, Any]) -> dict[str, Any]:
         """Execute the ``update_memory`` tool.
@@ -1241,8 +1287,7 @@ class MemoryMeshMCPServer:
         if metadata is not None:
             if not isinstance(metadata, dict):
                 return self._tool_error("'metadata' must be an object.")
-            meta_serialized = json.dumps(metadata, ensure_ascii=False)
-            if len(meta_serialized) > MAX_METADATA_SIZE:
+            if _metadata_too_large(metadata):
                 return self._tool_error(
                     f"'metadata' exceeds maximum size of {MAX_METADATA_SIZE} bytes."
                 )
@@ -1362,6 +1407,14 @@ class MemoryMeshMCPServer:
         Returns:
             MCP content response with health diagnostics.
         """
+        return self._tool_json(self._status_payload())
+
+    def _status_payload(self) -> dict[str, Any]:
+        """Build the ``status`` result as a plain dict.
+
+        Returns:
+            Health diagnostics for both stores and the embedding provider.
+        """
         embedding_name = os.environ.get("MEMORYMESH_EMBEDDING", "none")
 
         project_info: dict[str, Any]
@@ -1375,7 +1428,7 @@ class MemoryMeshMCPServer:
             project_info = {
                 "status": "not_configured",
                 "reason": "No project root detected",
-                "detection_attempted": self._detection_diagnostics,
+                "detection_attempted": list(self._detection_diagnostics),
                 "fix_options": [
                     "Use the 'configure_project' tool with path='/your/project/root'",
                     "Set MEMORYMESH_PROJECT_ROOT=/path/to/project in MCP server env config",
@@ -1399,7 +1452,7 @@ class MemoryMeshMCPServer:
                 "provider": embedding_name,
             },
         }
-        return self._tool_success(json.dumps(result, indent=2))
+        return result
 
     def _tool_configure_project(self, args: dict[str, Any]) -> dict[str, Any]:
         """Execute the ``configure_project`` tool.
@@ -1421,12 +1474,23 @@ class MemoryMeshMCPServer:
         if not os.path.isdir(path):
             return self._tool_error(f"Directory does not exist: {path}")
 
+        return self._tool_json(self._configure_project_payload(path))
+
+    def _configure_project_payload(self, path: str) -> dict[str, Any]:
+        """Switch the server to *path* and describe the new configuration.
+
+        Args:
+            path: Absolute, existing project root directory.
+
+        Returns:
+            The new project root and database paths as a plain dict.
+        """
         # Update project root and recreate the mesh.
         self._project_root = path
         if self._mesh is not None:
             self._mesh.close()
         self._mesh = self._create_mesh_from_env(project_root=path)
-        self._detection_diagnostics = [f"Manually configured via configure_project: {path}"]
+        self._detection_diagnostics = (f"Manually configured via configure_project: {path}",)
 
         logger.info(
             "Project configured at runtime: root=%s  db=%s",
@@ -1440,7 +1504,7 @@ class MemoryMeshMCPServer:
             "global_db": self._mesh.global_path,
             "message": f"Project configured successfully. Database at {self._mesh.project_path}",
         }
-        return self._tool_success(json.dumps(result, indent=2))
+        return result
 
     # ------------------------------------------------------------------
     # Response helpers
@@ -1465,6 +1529,18 @@ class MemoryMeshMCPServer:
             ],
         }
 
+    @classmethod
+    def _tool_json(cls, payload: dict[str, Any]) -> dict[str, Any]:
+        """Build a successful MCP tool result from a JSON-serialisable dict.
+
+        Args:
+            payload: The structured result to send to the client.
+
+        Returns:
+            MCP-formatted content response with *payload* as indented JSON.
+        """
+        return cls._tool_success(json.dumps(payload, indent=2))
+
     @staticmethod
     def _tool_error(message: str) -> dict[str, Any]:
         """Build an error MCP tool result.
@@ -1528,9 +1604,8 @@ class MemoryMeshMCPServer:
         }
         self._write_message(response)
 
-    @staticmethod
-    def _write_message(message: dict[str, Any]) -> None:
-        """Serialize and write a JSON-RPC message to stdout.
+    def _write_message(self, message: dict[str, Any]) -> None:
+        """Serialize and write a JSON-RPC message to the output stream.
 
         Each message is written as a single line of JSON followed by a
         newline, which is the standard framing for MCP over stdio.
@@ -1538,9 +1613,9 @@ class MemoryMeshMCPServer:
         Args:
             message: The JSON-RPC message dict to send.
         """
-        line = json.dumps(message, ensure_ascii=False)
-        sys.stdout.write(line + "\n")
-        sys.stdout.flush()
+        out = self._out if self._out is not None else sys.stdout
+        out.write(_WIRE_ENCODER.encode(message) + "\n")
+        out.flush()
 
 
 # ---------------------------------------------------------------------------
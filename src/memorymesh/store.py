@@ -7,6 +7,7 @@ local SQLite database.  No external server is required.
 from __future__ import annotations
 
 import contextlib
+import functools
 import json
 import math
 import os
@@ -14,7 +15,8 @@ import re
 import sqlite3
 import struct
 import threading
-from collections.abc import Generator
+import uuid
+from collections.abc import Generator, Iterable, Iterator, Sequence
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from typing import Any
@@ -34,54 +36,190 @@ _DEFAULT_GLOBAL_DIR = _DEFAULT_DIR
 _DEFAULT_GLOBAL_DB = os.path.join(_DEFAULT_GLOBAL_DIR, "global.db")
 _LEGACY_DB = _DEFAULT_DB
 
+# Special path that selects a private, non-persistent in-memory database
+# (mirrors :func:`sqlite3.connect`).
+_MEMORY_PATH = ":memory:"
+
+# Upsert statement shared by :meth:`MemoryStore.save` and
+# :meth:`MemoryStore.save_many`.
+_SAVE_SQL = """
+    INSERT OR REPLACE INTO memories
+        (id, text, metadata_json, embedding_blob,
+         created_at, updated_at, access_count,
+         importance, decay_rate, session_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 # Sentinel object to distinguish "not provided" from ``None`` in update calls.
 _UNSET: Any = object()
 
+# Scalar columns :meth:`MemoryStore.iter_columns` may select.  Text,
+# metadata and embeddings are excluded: they are the expensive columns and,
+# under encryption, the ones that need decrypting.
+_SCALAR_COLUMNS: frozenset[str] = frozenset(
+    {
+        "id",
+        "created_at",
+        "updated_at",
+        "access_count",
+        "importance",
+        "decay_rate",
+        "session_id",
+    }
+)
+
 
 # Project root marker files/directories.  A directory containing any of
 # these is considered a project root.
-_PROJECT_MARKERS = (
-    ".git",
-    "pyproject.toml",
-    "Cargo.toml",
-    "package.json",
-    "go.mod",
-    ".hg",
-    "build.gradle",
-    "pom.xml",
-    "CMakeLists.txt",
-    "Makefile",
-    ".memorymesh",
+_PROJECT_MARKERS: frozenset[str] = frozenset(
+    {
+        ".git",
+        "pyproject.toml",
+        "Cargo.toml",
+        "package.json",
+        "go.mod",
+        ".hg",
+        "build.gradle",
+        "pom.xml",
+        "CMakeLists.txt",
+        "Makefile",
+        ".memorymesh",
+    }
 )
 
 
 def _has_project_marker(directory: str) -> bool:
-    """Check whether *directory* contains a recognised project marker."""
+    """Check whether *directory* contains a recognised project marker.
+
+    Probes each marker by path rather than listing the directory: a
+    handful of ``stat`` calls stays cheap in huge directories such as
+    ``$HOME``, matches case-insensitively where the filesystem does, and
+    works in directories that can be searched but not listed.
+    """
     return any(os.path.exists(os.path.join(directory, marker)) for marker in _PROJECT_MARKERS)
 
 
+# Marker-less directories, mapped to the ``st_mtime_ns`` they were
+# listed at.  Creating or removing an entry (``git init``, a new
+# ``.memorymesh``) bumps a directory's mtime, so a single ``stat`` tells
+# a later walk-up whether the earlier listing still holds.  Capped at
+# ``_NO_MARKER_DIRS_MAXSIZE`` entries, oldest dropped first.
+_NO_MARKER_DIRS: dict[str, int] = {}
+_NO_MARKER_DIRS_MAXSIZE = 256
+
+# Successful walk-ups keyed by start directory, as ``(root, checked)``.
+# Misses are never stored here, so a marker created later is found by
+# the next detection.  Capped like :data:`_NO_MARKER_DIRS`.
+_MARKER_ROOTS: dict[str, tuple[str, int]] = {}
+_MARKER_ROOTS_MAXSIZE = 64
+
+
+def _cache_put(cache: dict[str, Any], key: str, value: Any, maxsize: int) -> None:
+    """Store *value* as the newest entry of *cache*, dropping the oldest."""
+    cache.pop(key, None)
+    cache[key] = value
+    while len(cache) > maxsize:
+        del cache[next(iter(cache))]
+
+
+def _walk_up_for_marker(start: str) -> tuple[str | None, int]:
+    """Walk up from *start* to the nearest directory with a project marker.
+
+    A walk that finds a root is cached per start directory, so repeated
+    detection from the same working directory costs a dict lookup.  A
+    walk that finds nothing is not cached; instead each directory it
+    listed is remembered with its mtime, and later walks skip listing a
+    directory again while its mtime is unchanged.  Use
+    :func:`clear_project_root_cache` to invalidate.
+
+    Args:
+        start: Absolute, symlink-resolved directory to start from.
+
+    Returns:
+        A ``(root, checked)`` tuple: the first directory containing a
+        marker (or ``None``) and how many directories were inspected.
+    """
+    cached = _MARKER_ROOTS.get(start)
+    if cached is not None:
+        return cached
+
+    current = start
+    checked = 0
+    while True:
+        checked += 1
+        try:
+            mtime_ns: int | None = os.stat(current).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if mtime_ns is None or _NO_MARKER_DIRS.get(current) != mtime_ns:
+            if _has_project_marker(current):
+                _cache_put(_MARKER_ROOTS, start, (current, checked), _MARKER_ROOTS_MAXSIZE)
+                return current, checked
+            if mtime_ns is not None:
+                _cache_put(_NO_MARKER_DIRS, current, mtime_ns, _NO_MARKER_DIRS_MAXSIZE)
+        parent = os.path.dirname(current)
+        if parent == current:
+            # Reached filesystem root.
+            return None, checked
+        current = parent
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_directory(path: str) -> str:
+    """Return ``os.path.realpath(path)``, cached per input path.
+
+    Resolving symlinks costs an ``lstat``/``readlink`` chain per path
+    component, and the working directory rarely changes within a process.
+    Use :func:`clear_project_root_cache` to invalidate.
+    """
+    return os.path.realpath(path)
+
+
+def clear_project_root_cache() -> None:
+    """Forget cached CWD walk-up results from :func:`detect_project_root`.
+
+    Call this after removing project markers (or re-pointing symlinks)
+    in a long-running process so the next detection re-scans the
+    filesystem.  Newly created markers are found without it.
+    """
+    _resolve_directory.cache_clear()
+    _MARKER_ROOTS.clear()
+    _NO_MARKER_DIRS.clear()
+
+
 def detect_project_root(
     roots: list[dict[str, Any]] | None = None,
     diagnostics: list[str] | None = None,
+    cwd: str | None = None,
 ) -> str | None:
     """Detect the project root directory.
 
     Priority:
         1. First URI in *roots* (from the MCP ``initialize`` request).
         2. ``MEMORYMESH_PROJECT_ROOT`` environment variable.
-        3. Current working directory **or any ancestor** that contains a
-           project marker (``.git``, ``pyproject.toml``, ``Cargo.toml``,
-           ``package.json``, ``go.mod``, ``.hg``, ``build.gradle``,
-           ``pom.xml``, ``CMakeLists.txt``, ``Makefile``,
-           ``.memorymesh``).  This mirrors the way ``git`` walks upward
-           to find the repository root.
+        3. *cwd* (the current working directory by default) **or any
+           ancestor** that contains a project marker (``.git``,
+           ``pyproject.toml``, ``Cargo.toml``, ``package.json``,
+           ``go.mod``, ``.hg``, ``build.gradle``, ``pom.xml``,
+           ``CMakeLists.txt``, ``Makefile``, ``.memorymesh``).  This
+           mirrors the way ``git`` walks upward to find the repository
+           root.
         4. ``None`` -- no project root detected.
 
+    The resolved start directory and a successful walk-up are cached per
+    directory, so a marker removed (or a symlink re-pointed) afterwards is
+    not noticed until :func:`clear_project_root_cache` is called.  Misses
+    are not cached: a marker created later, e.g. by ``git init``, is found
+    by the next call.
+
     Args:
         roots: The ``roots`` list from the MCP ``initialize`` params.
         diagnostics: If provided, human-readable descriptions of each
             detection step are appended to this list.  Useful for error
             messages and the ``status`` tool.
+        cwd: Directory to start the walk-up from.  Defaults to
+            :func:`os.getcwd`; passing it explicitly avoids depending on
+            process-wide state.
 
     Returns:
         An absolute directory path, or ``None``.
@@ -118,29 +256,22 @@ def detect_project_root(
         )
 
     # 3. Walk up from CWD looking for project markers (like git does).
-    cwd = os.getcwd()
-    current = os.path.realpath(cwd)
-    walked: list[str] = []
-    while True:
-        walked.append(current)
-        if _has_project_marker(current):
-            if diagnostics is not None:
-                diagnostics.append(f"CWD walk-up: {current} (project marker found)")
-            return current
-        parent = os.path.dirname(current)
-        if parent == current:
-            # Reached filesystem root.
-            break
-        current = parent
+    if cwd is None:
+        cwd = os.getcwd()
+    found, checked = _walk_up_for_marker(_resolve_directory(cwd))
+    if found is not None:
+        if diagnostics is not None:
+            diagnostics.append(f"CWD walk-up: {found} (project marker found)")
+        return found
 
     if diagnostics is not None:
-        if len(walked) == 1:
+        if checked <= 1:
             diagnostics.append(
-                f"CWD: {cwd} (no project marker found — checked {', '.join(_PROJECT_MARKERS)})"
+                f"CWD: {cwd} (no project marker found — checked {', '.join(sorted(_PROJECT_MARKERS))})"
             )
         else:
             diagnostics.append(
-                f"CWD walk-up: checked {len(walked)} directories from {cwd} "
+                f"CWD walk-up: checked {checked} directories from {cwd} "
                 f"to / (no project marker found)"
             )
 
@@ -235,7 +366,9 @@ class MemoryStore:
     Args:
         path: Path to the SQLite database file.  Parent directories are
             created automatically.  Defaults to
-            ``~/.memorymesh/memories.db``.
+            ``~/.memorymesh/memories.db``.  Pass ``":memory:"`` for an
+            ephemeral in-memory database that lives only as long as the
+            store's connections (useful for tests and scratch work).
     """
 
     # ------------------------------------------------------------------
@@ -244,16 +377,25 @@ class MemoryStore:
 
     def __init__(self, path: str | os.PathLike[str] | None = None) -> None:
         raw_path = str(path) if path is not None else _DEFAULT_DB
-        # Canonicalise and resolve symlinks to prevent traversal attacks.
-        self._path = os.path.realpath(os.path.expanduser(raw_path))
         self._local = threading.local()
+        self._in_memory = raw_path == _MEMORY_PATH
+
+        if self._in_memory:
+            # A uniquely named shared-cache database lets every per-thread
+            # connection of this store see the same data, while keeping it
+            # private to this instance.
+            self._path = _MEMORY_PATH
+            self._uri = f"file:memorymesh-{uuid.uuid4().hex}?mode=memory&cache=shared"
+        else:
+            # Canonicalise and resolve symlinks to prevent traversal attacks.
+            self._path = os.path.realpath(os.path.expanduser(raw_path))
 
-        # Ensure parent directory exists with restrictive permissions.
-        parent = os.path.dirname(self._path)
-        if parent:
-            os.makedirs(parent, mode=0o700, exist_ok=True)
-            with contextlib.suppress(OSError):
-                os.chmod(parent, 0o700)
+            # Ensure parent directory exists with restrictive permissions.
+            parent = os.path.dirname(self._path)
+            if parent:
+                os.makedirs(parent, mode=0o700, exist_ok=True)
+                with contextlib.suppress(OSError):
+                    os.chmod(parent, 0o700)
 
         # Initialise schema via the migration system.
         from .migrations import ensure_schema
@@ -262,8 +404,9 @@ class MemoryStore:
         self._schema_version = ensure_schema(conn)
 
         # Set restrictive permissions on the database file.
-        with contextlib.suppress(OSError):
-            os.chmod(self._path, 0o600)
+        if not self._in_memory:
+            with contextlib.suppress(OSError):
+                os.chmod(self._path, 0o600)
 
     @property
     def schema_version(self) -> int:
@@ -282,7 +425,10 @@ class MemoryStore:
         """Return (or create) a SQLite connection for the current thread."""
         conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
         if conn is None:
-            conn = sqlite3.connect(self._path)
+            if self._in_memory:
+                conn = sqlite3.connect(self._uri, uri=True)
+            else:
+                conn = sqlite3.connect(self._path)
             conn.execute("PRAGMA journal_mode=WAL;")
             conn.execute("PRAGMA foreign_keys=ON;")
             conn.execute("PRAGMA busy_timeout = 5000;")
@@ -292,9 +438,19 @@ class MemoryStore:
 
     @contextmanager
     def _cursor(self) -> Generator[sqlite3.Cursor, None, None]:
-        """Context manager that yields a cursor and commits on success."""
+        """Context manager that yields a cursor and commits on success.
+
+        Inside :meth:`transaction` the commit (or rollback) is left to the
+        enclosing transaction instead.
+        """
         conn = self._get_connection()
         cur = conn.cursor()
+        if getattr(self._local, "tx_depth", 0):
+            try:
+                yield cur
+            finally:
+                cur.close()
+            return
         try:
             yield cur
             conn.commit()
@@ -304,6 +460,35 @@ class MemoryStore:
         finally:
             cur.close()
 
+    @contextmanager
+    def transaction(self) -> Generator[None, None, None]:
+        """Group several store calls into a single SQLite transaction.
+
+        Writes made on the current thread inside the block are committed
+        once when the outermost block exits, or rolled back together if it
+        raises.  Reads inside the block see the uncommitted writes.  Blocks
+        may be nested; only the outermost one commits.
+
+        Example::
+
+            with store.transaction():
+                store.save(first)
+                store.save(second)
+        """
+        depth: int = getattr(self._local, "tx_depth", 0)
+        self._local.tx_depth = depth + 1
+        try:
+            yield
+        except BaseException:
+            if depth == 0:
+                self._get_connection().rollback()
+            raise
+        else:
+            if depth == 0:
+                self._get_connection().commit()
+        finally:
+            self._local.tx_depth = depth
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -318,27 +503,19 @@ class MemoryStore:
             memory: The :class:`Memory` to persist.
         """
         with self._cursor() as cur:
-            cur.execute(
-                """
-                INSERT OR REPLACE INTO memories
-                    (id, text, metadata_json, embedding_blob,
-                     created_at, updated_at, access_count,
-                     importance, decay_rate, session_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    memory.id,
-                    memory.text,
-                    json.dumps(memory.metadata, ensure_ascii=False),
-                    _pack_embedding(memory.embedding),
-                    memory.created_at.isoformat(),
-                    memory.updated_at.isoformat(),
-                    memory.access_count,
-                    memory.importance,
-                    memory.decay_rate,
-                    memory.session_id,
-                ),
-            )
+            cur.execute(_SAVE_SQL, self._memory_to_row(memory))
+
+    def save_many(self, memories: Iterable[Memory]) -> None:
+        """Insert or replace several memories in a single transaction.
+
+        Equivalent to calling :meth:`save` for each memory, but uses one
+        ``executemany`` and one commit instead of a transaction per row.
+
+        Args:
+            memories: The :class:`Memory` objects to persist.
+        """
+        with self._cursor() as cur:
+            cur.executemany(_SAVE_SQL, [self._memory_to_row(m) for m in memories])
 
     def get(self, memory_id: str) -> Memory | None:
         """Retrieve a single memory by its ID.
@@ -695,6 +872,42 @@ class MemoryStore:
             rows = cur.fetchall()
         return [self._row_to_memory(r) for r in rows]
 
+    def iter_columns(self, columns: Sequence[str]) -> Iterator[tuple[Any, ...]]:
+        """Iterate over selected scalar columns of every memory.
+
+        Rows are streamed from the cursor without building :class:`Memory`
+        objects, for callers that only need a few fields.
+
+        Args:
+            columns: Column names, each one of ``id``, ``created_at``,
+                ``updated_at``, ``access_count``, ``importance``,
+                ``decay_rate`` or ``session_id``.
+
+        Returns:
+            An iterator of one tuple per memory, in *columns* order, most
+            recently updated first.
+
+        Raises:
+            ValueError: If *columns* is empty or names another column.
+        """
+        unknown = sorted(set(columns) - _SCALAR_COLUMNS)
+        if unknown or not columns:
+            raise ValueError(
+                f"Cannot iterate columns {unknown or list(columns)!r}; "
+                f"choose from {sorted(_SCALAR_COLUMNS)!r}"
+            )
+        # Validated eagerly; only the fetching below is deferred.
+        return self._iter_rows(
+            f"SELECT {', '.join(columns)} FROM memories ORDER BY updated_at DESC"
+        )
+
+    def _iter_rows(self, sql: str) -> Iterator[tuple[Any, ...]]:
+        """Execute *sql* and yield each result row as a plain tuple."""
+        with self._cursor() as cur:
+            cur.execute(sql)
+            for row in cur:
+                yield tuple(row)
+
     def count(self) -> int:
         """Return the total number of stored memories.
 
@@ -848,6 +1061,22 @@ class MemoryStore:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _memory_to_row(memory: Memory) -> tuple[Any, ...]:
+        """Convert a :class:`Memory` into parameters for ``_SAVE_SQL``."""
+        return (
+            memory.id,
+            memory.text,
+            json.dumps(memory.metadata, ensure_ascii=False),
+            _pack_embedding(memory.embedding),
+            memory.created_at.isoformat(),
+            memory.updated_at.isoformat(),
+            memory.access_count,
+            memory.importance,
+            memory.decay_rate,
+            memory.session_id,
+        )
+
     @staticmethod
     def _row_to_memory(row: sqlite3.Row) -> Memory:
         """Convert a database row into a :class:`Memory` instance."""
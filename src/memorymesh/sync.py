@@ -23,7 +23,7 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from .formats.claude import ClaudeAdapter
 
@@ -105,23 +105,27 @@ def sync_from_memory_md(
     if not entries:
         return 0
 
-    from .formats._shared import is_duplicate
+    from .formats._shared import build_duplicate_index, is_duplicate_indexed, normalise
 
-    imported = 0
+    seen = build_duplicate_index(mesh.list(limit=mesh.count(scope=scope), scope=scope))
+
+    batch: list[dict[str, Any]] = []
     for text, importance, _metadata in entries:
-        existing = mesh.recall(query=text, k=5, scope=scope)
-        if is_duplicate(text, existing):
+        if is_duplicate_indexed(text, seen):
             continue
 
-        mesh.remember(
-            text=text,
-            metadata={"source": "memory.md", "imported": True},
-            importance=importance,
-            scope=scope,
+        batch.append(
+            {
+                "text": text,
+                "metadata": {"source": "memory.md", "imported": True},
+                "importance": importance,
+                "scope": scope,
+            }
         )
-        imported += 1
+        seen.add(normalise(text))
 
-    return imported
+    mesh.remember_many(batch)
+    return len(batch)
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,81 @@
+"""Suite-wide test configuration.
+
+Test databases live in temporary directories and are thrown away after
+each run, so the durability guarantees that ``MemoryStore`` normally
+relies on only cost time here.  Every new store connection is switched to
+``synchronous=OFF`` and ``temp_store=MEMORY`` so commits no longer wait on
+``fsync``.  This is **not** safe for real databases and must never be
+copied into library code.
+
+``journal_mode`` and ``locking_mode`` are deliberately left alone: the
+store's WAL setup is behaviour under test, and several tests open a
+second raw ``sqlite3`` connection to the same file.
+
+:func:`~memorymesh.store.detect_project_root` caches its CWD walk-up per
+directory, so the cache is cleared around every test to keep markers
+created (or monkeypatched) by one test from leaking into the next.
+
+Tests that only need an empty, in-memory :class:`~memorymesh.MemoryMesh`
+use the :func:`mesh` fixture.  One instance is shared per module and reset
+after each test; modules that need files on disk or a fresh mesh per test
+override ``mesh`` locally.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterator
+
+import pytest
+
+from memorymesh import MemoryMesh
+from memorymesh.store import MemoryStore, clear_project_root_cache
+
+_FAST_PRAGMAS = "PRAGMA synchronous=OFF; PRAGMA temp_store=MEMORY;"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _fast_sqlite_pragmas() -> Iterator[None]:
+    """Apply non-durable PRAGMAs to every connection a MemoryStore opens."""
+    original = MemoryStore._get_connection
+
+    def _get_connection(self: MemoryStore) -> sqlite3.Connection:
+        fresh = getattr(self._local, "conn", None) is None
+        conn = original(self)
+        if fresh:
+            conn.executescript(_FAST_PRAGMAS)
+        return conn
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(MemoryStore, "_get_connection", _get_connection)
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _fresh_project_root_cache() -> Iterator[None]:
+    """Stop cached project-root walk-ups leaking between tests."""
+    clear_project_root_cache()
+    yield
+    clear_project_root_cache()
+
+
+@pytest.fixture(scope="module")
+def shared_mesh() -> Iterator[MemoryMesh]:
+    """An in-memory MemoryMesh built once per module."""
+    m = MemoryMesh(path=":memory:", global_path=":memory:", embedding="none")
+    yield m
+    m.close()
+
+
+@pytest.fixture
+def mesh(shared_mesh: MemoryMesh) -> Iterator[MemoryMesh]:
+    """The module-wide mesh, reset to a fresh mesh's state after each test.
+
+    Both scopes are emptied and the auto-compaction write counter is
+    zeroed, so compaction fires at the same point in every test whatever
+    ran before it.
+    """
+    yield shared_mesh
+    shared_mesh.forget_all(scope="project")
+    shared_mesh.forget_all(scope="global")
+    shared_mesh._writes_since_compact = 0
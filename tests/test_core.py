@@ -7,6 +7,8 @@ so they run without any ML dependencies.
 
 from __future__ import annotations
 
+import pytest
+
 from memorymesh import MemoryMesh
 
 # ------------------------------------------------------------------
@@ -81,6 +83,59 @@ def test_remember_with_metadata(tmp_path):
     assert matched[0].metadata["session_id"] == "abc-123"
 
 
+def test_remember_many(tmp_path):
+    """remember_many() stores every item and returns IDs in input order."""
+    mesh = MemoryMesh(
+        path=str(tmp_path / "mem.db"), embedding="none", global_path=str(tmp_path / "global.db")
+    )
+    ids = mesh.remember_many(
+        [
+            {"text": "Architecture uses dual-store pattern", "importance": 0.9, "scope": "project"},
+            {"text": "User prefers dark mode", "importance": 1.0, "scope": "global"},
+            {"text": "Architecture uses dual-store pattern", "scope": "project"},
+        ]
+    )
+
+    assert len(ids) == 3
+    # The repeated text is deduplicated against the earlier item.
+    assert ids[2] == ids[0]
+    assert mesh.get(ids[0]).importance == 0.9
+    assert mesh.get(ids[1]).scope == "global"
+    assert mesh.count() == 2
+
+
+def test_remember_many_rolls_back_on_error(tmp_path):
+    """A failing item discards the whole remember_many() batch."""
+    mesh = MemoryMesh(
+        path=str(tmp_path / "mem.db"), embedding="none", global_path=str(tmp_path / "global.db")
+    )
+    with pytest.raises(ValueError):
+        mesh.remember_many(
+            [
+                {"text": "Tests use pytest", "scope": "project"},
+                {"text": "Broken item", "category": "not-a-category"},
+            ]
+        )
+    assert mesh.count() == 0
+
+
+def test_iter_memories_by_scope(tmp_path):
+    """iter_memories() yields the selected columns from the requested stores."""
+    mesh = MemoryMesh(
+        path=str(tmp_path / "mem.db"), embedding="none", global_path=str(tmp_path / "global.db")
+    )
+    mesh.remember_many(
+        [
+            {"text": "Architecture uses dual-store pattern", "importance": 0.9, "scope": "project"},
+            {"text": "User prefers dark mode", "importance": 1.0, "scope": "global"},
+        ]
+    )
+
+    assert list(mesh.iter_memories(("importance",), scope="project")) == [(0.9,)]
+    assert list(mesh.iter_memories(("importance",), scope="global")) == [(1.0,)]
+    assert sorted(mesh.iter_memories(("importance",))) == [(0.9,), (1.0,)]
+
+
 # ------------------------------------------------------------------
 # forget()
 # ------------------------------------------------------------------
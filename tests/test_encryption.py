@@ -300,6 +300,25 @@ class TestEncryptedMemoryStore:
         # Should look like base64.
         base64.b64decode(raw_text)
 
+    def test_save_many_encrypts_each_memory(self, store, raw_store) -> None:
+        """save_many encrypts every memory and they decrypt on read."""
+        mems = [Memory(text=f"Batch secret {i}", metadata={"i": i}) for i in range(3)]
+        store.save_many(mems)
+
+        for mem in mems:
+            assert raw_store.get(mem.id).text != mem.text
+            retrieved = store.get(mem.id)
+            assert retrieved is not None
+            assert retrieved.text == mem.text
+            assert retrieved.metadata == mem.metadata
+
+    def test_transaction_rolls_back_encrypted_writes(self, store) -> None:
+        """transaction() delegates to the wrapped store."""
+        with pytest.raises(RuntimeError), store.transaction():
+            store.save(Memory(text="Never committed"))
+            raise RuntimeError("boom")
+        assert store.count() == 0
+
     def test_list_all_decrypts(self, store) -> None:
         """list_all returns decrypted memories."""
         mem1 = Memory(text="First memory")
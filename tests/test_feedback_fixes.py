@@ -8,15 +8,35 @@ from __future__ import annotations
 
 import json
 import os
-import tempfile
-from collections.abc import Generator
 from pathlib import Path
 
 import pytest
 
 from memorymesh.core import MemoryMesh
 from memorymesh.mcp_server import MemoryMeshMCPServer
-from memorymesh.store import _PROJECT_MARKERS, detect_project_root
+from memorymesh.store import (
+    _PROJECT_MARKERS,
+    _cache_put,
+    _has_project_marker,
+    clear_project_root_cache,
+    detect_project_root,
+)
+
+_EXPECTED_MARKERS = frozenset(
+    {
+        ".git",
+        "pyproject.toml",
+        "Cargo.toml",
+        "package.json",
+        "go.mod",
+        ".hg",
+        "build.gradle",
+        "pom.xml",
+        "CMakeLists.txt",
+        "Makefile",
+        ".memorymesh",
+    }
+)
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -24,30 +44,36 @@ from memorymesh.store import _PROJECT_MARKERS, detect_project_root
 
 
 @pytest.fixture
-def tmp_dir():
-    """Create a temporary directory for test databases."""
-    with tempfile.TemporaryDirectory() as d:
-        yield d
+def tmp_dir(tmp_path: Path) -> str:
+    """Return a per-test temporary directory for test databases."""
+    return str(tmp_path)
 
 
 @pytest.fixture
-def mesh(tmp_dir: str) -> Generator[MemoryMesh, None, None]:
-    """Create a MemoryMesh instance with both stores."""
-    db_path = os.path.join(tmp_dir, "project.db")
-    global_path = os.path.join(tmp_dir, "global.db")
-    m = MemoryMesh(path=db_path, global_path=global_path, embedding="none")
-    yield m
-    m.close()
+def tmp_path_real(tmp_path: Path) -> str:
+    """Return *tmp_path* with symlinks resolved, as detect_project_root reports it."""
+    return os.path.realpath(str(tmp_path))
 
 
-@pytest.fixture
-def mcp_server(mesh: MemoryMesh) -> MemoryMeshMCPServer:
-    """Create an MCP server wrapping the test mesh."""
-    server = MemoryMeshMCPServer(mesh=mesh)
-    server._initialized = True
+@pytest.fixture(scope="module")
+def shared_mcp_server(shared_mesh: MemoryMesh) -> MemoryMeshMCPServer:
+    """Create one MCP server wrapping the module-wide mesh."""
+    server = MemoryMeshMCPServer(mesh=shared_mesh)
     return server
 
 
+@pytest.fixture(scope="module")
+def uninit_server() -> MemoryMeshMCPServer:
+    """A server that never received ``initialize``; tests must not mutate it."""
+    return MemoryMeshMCPServer()
+
+
+@pytest.fixture
+def mcp_server(shared_mcp_server: MemoryMeshMCPServer, mesh: MemoryMesh) -> MemoryMeshMCPServer:
+    """The module-wide MCP server, reset along with its mesh after each test."""
+    return shared_mcp_server
+
+
 # ---------------------------------------------------------------------------
 # TestExpandedProjectMarkers
 # ---------------------------------------------------------------------------
@@ -56,52 +82,24 @@ def mcp_server(mesh: MemoryMesh) -> MemoryMeshMCPServer:
 class TestExpandedProjectMarkers:
     """detect_project_root() recognises markers beyond .git and pyproject.toml."""
 
-    @pytest.mark.parametrize(
-        "marker",
-        [
-            ".git",
-            "pyproject.toml",
-            "Cargo.toml",
-            "package.json",
-            "go.mod",
-            ".hg",
-            "build.gradle",
-            "pom.xml",
-            "CMakeLists.txt",
-            "Makefile",
-            ".memorymesh",
-        ],
-    )
-    def test_cwd_detects_marker(self, tmp_path, monkeypatch, marker):
+    def test_cwd_detects_each_marker(self, tmp_path, monkeypatch):
         """CWD heuristic finds projects with any recognised marker."""
-        marker_path = tmp_path / marker
-        if marker in (".git", ".hg", ".memorymesh"):
-            marker_path.mkdir()
-        else:
-            marker_path.touch()
-
-        monkeypatch.chdir(tmp_path)
         monkeypatch.delenv("MEMORYMESH_PROJECT_ROOT", raising=False)
 
-        result = detect_project_root(None)
-        assert result == os.path.realpath(str(tmp_path))
+        for marker in sorted(_EXPECTED_MARKERS):
+            project = tmp_path / f"proj_{marker.lstrip('.')}"
+            project.mkdir()
+            if marker in (".git", ".hg", ".memorymesh"):
+                (project / marker).mkdir()
+            else:
+                (project / marker).touch()
+
+            root = detect_project_root(None, cwd=str(project))
+            assert root == os.path.realpath(str(project)), marker
 
     def test_project_markers_constant_complete(self):
         """All expected markers are in _PROJECT_MARKERS."""
-        expected = {
-            ".git",
-            "pyproject.toml",
-            "Cargo.toml",
-            "package.json",
-            "go.mod",
-            ".hg",
-            "build.gradle",
-            "pom.xml",
-            "CMakeLists.txt",
-            "Makefile",
-            ".memorymesh",
-        }
-        assert set(_PROJECT_MARKERS) == expected
+        assert _PROJECT_MARKERS == _EXPECTED_MARKERS
 
 
 # ---------------------------------------------------------------------------
@@ -112,29 +110,25 @@ class TestExpandedProjectMarkers:
 class TestWalkUpDetection:
     """detect_project_root() walks up from CWD to find project markers."""
 
-    def test_walk_up_finds_git_in_parent(self, tmp_path, monkeypatch):
+    def test_walk_up_finds_git_in_parent(self, tmp_path, tmp_path_real, monkeypatch):
         """Finds .git in a parent directory when CWD is a subdirectory."""
         (tmp_path / ".git").mkdir()
         subdir = tmp_path / "src" / "components"
         subdir.mkdir(parents=True)
 
-        monkeypatch.chdir(subdir)
         monkeypatch.delenv("MEMORYMESH_PROJECT_ROOT", raising=False)
 
-        result = detect_project_root(None)
-        assert result == os.path.realpath(str(tmp_path))
+        assert detect_project_root(None, cwd=str(subdir)) == tmp_path_real
 
-    def test_walk_up_finds_cargo_in_parent(self, tmp_path, monkeypatch):
+    def test_walk_up_finds_cargo_in_parent(self, tmp_path, tmp_path_real, monkeypatch):
         """Finds Cargo.toml in parent when CWD is a Rust subdirectory."""
         (tmp_path / "Cargo.toml").touch()
         subdir = tmp_path / "src"
         subdir.mkdir()
 
-        monkeypatch.chdir(subdir)
         monkeypatch.delenv("MEMORYMESH_PROJECT_ROOT", raising=False)
 
-        result = detect_project_root(None)
-        assert result == os.path.realpath(str(tmp_path))
+        assert detect_project_root(None, cwd=str(subdir)) == tmp_path_real
 
     def test_walk_up_stops_at_nearest_marker(self, tmp_path, monkeypatch):
         """Picks the nearest ancestor with a marker, not the root."""
@@ -145,10 +139,9 @@ class TestWalkUpDetection:
         inner.mkdir(parents=True)
         (inner / "package.json").touch()
 
-        monkeypatch.chdir(inner)
         monkeypatch.delenv("MEMORYMESH_PROJECT_ROOT", raising=False)
 
-        result = detect_project_root(None)
+        result = detect_project_root(None, cwd=str(inner))
         assert result == os.path.realpath(str(inner))
 
     def test_walk_up_returns_none_at_root(self, tmp_path, monkeypatch):
@@ -158,14 +151,89 @@ class TestWalkUpDetection:
         deep = tmp_path / "a" / "b" / "c"
         deep.mkdir(parents=True)
 
-        monkeypatch.chdir(deep)
         monkeypatch.delenv("MEMORYMESH_PROJECT_ROOT", raising=False)
 
         # Note: this may find the MemoryMesh project root if we're running
         # inside it. To isolate, we'd need to mock os.path.dirname,
         # but the principle is tested via the positive cases above.
         # Just verify it doesn't crash.
-        detect_project_root(None)
+        detect_project_root(None, cwd=str(deep))
+
+    def test_walk_up_defaults_to_process_cwd(self, tmp_path, tmp_path_real, monkeypatch):
+        """Without an explicit cwd, the walk-up starts from os.getcwd()."""
+        (tmp_path / ".git").mkdir()
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("MEMORYMESH_PROJECT_ROOT", raising=False)
+
+        assert detect_project_root(None) == tmp_path_real
+
+    def test_walk_up_result_cached_until_cleared(self, tmp_path, tmp_path_real, monkeypatch):
+        """Repeat detection from the same CWD reuses the cached walk-up."""
+        marker = tmp_path / "pyproject.toml"
+        marker.touch()
+        monkeypatch.delenv("MEMORYMESH_PROJECT_ROOT", raising=False)
+
+        assert detect_project_root(None, cwd=str(tmp_path)) == tmp_path_real
+
+        marker.unlink()
+        assert detect_project_root(None, cwd=str(tmp_path)) == tmp_path_real
+
+        clear_project_root_cache()
+        assert detect_project_root(None, cwd=str(tmp_path)) != tmp_path_real
+
+    def test_walk_up_skips_unchanged_markerless_ancestors(self, tmp_path, monkeypatch):
+        """A failed walk-up spares later walks from re-listing its directories."""
+        outer = tmp_path / "outer"
+        inner = outer / "a" / "b"
+        inner.mkdir(parents=True)
+        monkeypatch.delenv("MEMORYMESH_PROJECT_ROOT", raising=False)
+        if detect_project_root(None, cwd=str(outer)) is not None:
+            pytest.skip("temporary directory is inside a project")
+
+        probed: list[str] = []
+        monkeypatch.setattr(
+            "memorymesh.store._has_project_marker",
+            lambda directory: probed.append(directory) or False,
+        )
+        assert detect_project_root(None, cwd=str(inner)) is None
+        assert probed == [os.path.realpath(str(inner)), os.path.realpath(str(inner.parent))]
+
+    def test_marker_created_after_miss_is_found(self, tmp_path, tmp_path_real, monkeypatch):
+        """A miss is not cached, so a later ``git init`` is noticed."""
+        monkeypatch.delenv("MEMORYMESH_PROJECT_ROOT", raising=False)
+        if detect_project_root(None, cwd=str(tmp_path)) is not None:
+            pytest.skip("temporary directory is inside a project")
+
+        (tmp_path / ".git").mkdir()
+        assert detect_project_root(None, cwd=str(tmp_path)) == tmp_path_real
+
+    def test_repeated_miss_reports_full_walk(self, tmp_path, monkeypatch):
+        """Diagnostics count every directory, including ones already known."""
+        inner = tmp_path / "a" / "b"
+        inner.mkdir(parents=True)
+        monkeypatch.delenv("MEMORYMESH_PROJECT_ROOT", raising=False)
+        first: list[str] = []
+        if detect_project_root(None, diagnostics=first, cwd=str(inner)) is not None:
+            pytest.skip("temporary directory is inside a project")
+
+        again: list[str] = []
+        detect_project_root(None, diagnostics=again, cwd=str(inner))
+        assert again == first
+
+        parent: list[str] = []
+        detect_project_root(None, diagnostics=parent, cwd=str(tmp_path))
+        assert parent[-1].startswith("CWD walk-up: checked ")
+
+    def test_walk_up_caches_are_bounded(self):
+        """Only the most recently stored entries are kept."""
+        cache: dict[str, int] = {}
+        for i, key in enumerate(["/a", "/a/b", "/c", "/c/d"]):
+            _cache_put(cache, key, i, maxsize=3)
+        assert list(cache) == ["/a/b", "/c", "/c/d"]
+
+    def test_missing_directory_has_no_marker(self, tmp_path):
+        """A directory that does not exist is treated as marker-less."""
+        assert _has_project_marker(str(tmp_path / "missing")) is False
 
 
 # ---------------------------------------------------------------------------
@@ -179,11 +247,10 @@ class TestDetectionDiagnostics:
     def test_diagnostics_populated_on_success(self, tmp_path, monkeypatch):
         """Diagnostics list is populated even on success."""
         (tmp_path / ".git").mkdir()
-        monkeypatch.chdir(tmp_path)
         monkeypatch.delenv("MEMORYMESH_PROJECT_ROOT", raising=False)
 
         diagnostics: list[str] = []
-        result = detect_project_root(None, diagnostics=diagnostics)
+        result = detect_project_root(None, diagnostics=diagnostics, cwd=str(tmp_path))
 
         assert result is not None
         assert len(diagnostics) >= 1
@@ -192,11 +259,10 @@ class TestDetectionDiagnostics:
         """Diagnostics explain what was tried when detection fails."""
         deep = tmp_path / "empty"
         deep.mkdir()
-        monkeypatch.chdir(deep)
         monkeypatch.delenv("MEMORYMESH_PROJECT_ROOT", raising=False)
 
         diagnostics: list[str] = []
-        detect_project_root(None, diagnostics=diagnostics)
+        detect_project_root(None, diagnostics=diagnostics, cwd=str(deep))
 
         # Should have at least MCP roots + env var + CWD entries
         assert len(diagnostics) >= 2
@@ -239,21 +305,18 @@ class TestStatusTool:
         assert data["global_store"]["count"] >= 0
         assert "version" in data
 
-    def test_status_without_project(self, tmp_dir):
+    def test_status_without_project(self):
         """Status reports project as not_configured with fix options."""
         # Create mesh with global-only (no project path)
-        global_path = os.path.join(tmp_dir, "global.db")
-        mesh = MemoryMesh(global_path=global_path, embedding="none")
+        mesh = MemoryMesh(global_path=":memory:", embedding="none")
         try:
             server = MemoryMeshMCPServer(mesh=mesh)
-            server._initialized = True
-            server._detection_diagnostics = [
+            server._detection_diagnostics = (
                 "MCP roots: not provided by client",
                 "MEMORYMESH_PROJECT_ROOT: not set",
-            ]
+            )
 
-            result = server._tool_status({})
-            data = json.loads(result["content"][0]["text"])
+            data = server._status_payload()
 
             assert data["project_store"]["status"] == "not_configured"
             assert "fix_options" in data["project_store"]
@@ -284,7 +347,6 @@ class TestConfigureProjectTool:
         mesh = MemoryMesh(global_path=global_path, embedding="none")
         try:
             server = MemoryMeshMCPServer(mesh=mesh)
-            server._initialized = True
 
             # Verify project is not configured initially
             assert mesh.project_path is None
@@ -326,23 +388,19 @@ class TestSessionStartHealth:
 
     def test_session_start_includes_health(self, mcp_server):
         """session_start response includes store_health field."""
-        result = mcp_server._tool_session_start({})
-        data = json.loads(result["content"][0]["text"])
+        data = mcp_server._session_start_payload(None)
 
         assert "store_health" in data
         assert data["store_health"]["global_store"] == "ok"
         assert data["store_health"]["project_store"] == "ok"
 
-    def test_session_start_health_warns_when_no_project(self, tmp_dir):
+    def test_session_start_health_warns_when_no_project(self):
         """session_start warns when project store is not configured."""
-        global_path = os.path.join(tmp_dir, "global.db")
-        mesh = MemoryMesh(global_path=global_path, embedding="none")
+        mesh = MemoryMesh(global_path=":memory:", embedding="none")
         try:
             server = MemoryMeshMCPServer(mesh=mesh)
-            server._initialized = True
 
-            result = server._tool_session_start({})
-            data = json.loads(result["content"][0]["text"])
+            data = server._session_start_payload(None)
 
             assert data["store_health"]["project_store"] == "not_configured"
             assert "warning" in data["store_health"]
@@ -350,6 +408,11 @@ class TestSessionStartHealth:
         finally:
             mesh.close()
 
+    def test_session_start_payload_without_mesh(self):
+        """The payload reports an error instead of failing without a mesh."""
+        data = MemoryMeshMCPServer()._session_start_payload(None)
+        assert "not initialized" in data["error"]
+
 
 # ---------------------------------------------------------------------------
 # TestLazyInitialization
@@ -359,11 +422,10 @@ class TestSessionStartHealth:
 class TestLazyInitialization:
     """MCP server uses lazy initialization (no double-init)."""
 
-    def test_constructor_without_mesh(self):
+    def test_constructor_without_mesh(self, uninit_server):
         """Server can be created without a mesh (lazy init)."""
-        server = MemoryMeshMCPServer()
-        assert server._mesh is None
-        assert server._initialized is False
+        assert uninit_server._mesh is None
+        assert uninit_server._initialized is False
 
     def test_constructor_with_mesh(self, mesh):
         """Server can still accept a pre-built mesh."""
@@ -390,11 +452,9 @@ class TestLazyInitialization:
         assert "protocolVersion" in result
         server._mesh.close()
 
-    def test_tool_call_before_init_errors(self):
+    def test_tool_call_before_init_errors(self, uninit_server):
         """Tool calls before initialize return an error."""
-        server = MemoryMeshMCPServer()
-
-        result = server._handle_tools_call(
+        result = uninit_server._handle_tools_call(
             {
                 "name": "recall",
                 "arguments": {"query": "test"},
@@ -427,10 +487,9 @@ class TestLazyInitialization:
 class TestImprovedErrorMessages:
     """Error messages include actionable fix steps."""
 
-    def test_project_scope_error_has_fix_options(self, tmp_dir):
+    def test_project_scope_error_has_fix_options(self):
         """RuntimeError for missing project includes fix steps."""
-        global_path = os.path.join(tmp_dir, "global.db")
-        mesh = MemoryMesh(global_path=global_path, embedding="none")
+        mesh = MemoryMesh(global_path=":memory:", embedding="none")
         try:
             with pytest.raises(RuntimeError) as exc_info:
                 mesh.remember("test", scope="project")
@@ -443,10 +502,9 @@ class TestImprovedErrorMessages:
         finally:
             mesh.close()
 
-    def test_global_scope_always_works(self, tmp_dir):
+    def test_global_scope_always_works(self):
         """Global scope works even without project configuration."""
-        global_path = os.path.join(tmp_dir, "global.db")
-        mesh = MemoryMesh(global_path=global_path, embedding="none")
+        mesh = MemoryMesh(global_path=":memory:", embedding="none")
         try:
             # This should NOT raise
             memory_id = mesh.remember("test global", scope="global")
@@ -464,18 +522,22 @@ class TestImprovedErrorMessages:
 class TestInitConfigPath:
     """memorymesh init writes to settings.json (not legacy path)."""
 
-    def test_init_writes_settings_json(self, tmp_path, monkeypatch, capsys):
+    def test_init_writes_settings_json(self, tmp_path, capsys):
         """init creates ~/.claude/settings.json, not claude_code_config.json."""
         from memorymesh.init_cmd import run_init
 
         fake_home = tmp_path / "home"
         fake_home.mkdir()
-        monkeypatch.setattr(os.path, "expanduser", lambda p: p.replace("~", str(fake_home)))
 
         project_dir = tmp_path / "project"
         project_dir.mkdir()
 
-        rc = run_init(project_path=str(project_dir), skip_mcp=False, skip_claude_md=True)
+        rc = run_init(
+            project_path=str(project_dir),
+            skip_mcp=False,
+            skip_claude_md=True,
+            home_dir=str(fake_home),
+        )
         assert rc == 0
 
         # settings.json should exist
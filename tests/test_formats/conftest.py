@@ -0,0 +1,32 @@
+"""Fixtures shared by the format adapter tests."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from memorymesh import MemoryMesh
+from memorymesh.formats import FormatAdapter
+
+
+@pytest.fixture()
+def mesh() -> Iterator[MemoryMesh]:
+    """An empty mesh for tests that import into it or export nothing.
+
+    None of the format tests inspect the database files, so both stores
+    live in memory.
+    """
+    m = MemoryMesh(path=":memory:", global_path=":memory:", embedding="none")
+    yield m
+    m.close()
+
+
+@pytest.fixture()
+def output_path(tmp_path: Path, adapter: FormatAdapter) -> Path:
+    """The adapter's own file name inside ``tmp_path``.
+
+    Relies on each test module providing an ``adapter`` fixture.
+    """
+    return tmp_path / adapter.file_names[0]
@@ -2,11 +2,8 @@
 
 from __future__ import annotations
 
-import os
-
 import pytest
 
-from memorymesh import MemoryMesh
 from memorymesh.formats import create_format_adapter, sync_from_format, sync_to_format
 
 # ---------------------------------------------------------------------------
@@ -14,28 +11,30 @@ from memorymesh.formats import create_format_adapter, sync_from_format, sync_to_
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def adapter():
     return create_format_adapter("claude")
 
 
-@pytest.fixture()
-def mesh(tmp_path):
-    m = MemoryMesh(
-        path=str(tmp_path / "project.db"),
-        global_path=str(tmp_path / "global.db"),
-        embedding="none",
+@pytest.fixture(scope="module")
+def populated_mesh(shared_mesh):
+    # The export tests only read from the mesh, so it is populated once.
+    shared_mesh.remember_many(
+        [
+            {"text": "Architecture uses dual-store pattern", "importance": 0.9, "scope": "project"},
+            {"text": "User prefers dark mode", "importance": 1.0, "scope": "global"},
+            {"text": "Tests use pytest", "importance": 0.6, "scope": "project"},
+        ]
     )
-    yield m
-    m.close()
+    return shared_mesh
 
 
-@pytest.fixture()
-def populated_mesh(mesh):
-    mesh.remember("Architecture uses dual-store pattern", importance=0.9, scope="project")
-    mesh.remember("User prefers dark mode", importance=1.0, scope="global")
-    mesh.remember("Tests use pytest", importance=0.6, scope="project")
-    return mesh
+@pytest.fixture(scope="module")
+def exported_content(adapter, populated_mesh, tmp_path_factory):
+    # Content-only assertions share a single export.
+    output = tmp_path_factory.mktemp("export") / "MEMORY.md"
+    sync_to_format(populated_mesh, adapter, str(output))
+    return output.read_text()
 
 
 # ---------------------------------------------------------------------------
@@ -43,46 +42,28 @@ def populated_mesh(mesh):
 # ---------------------------------------------------------------------------
 
 
-def test_export_creates_file(tmp_path, adapter, populated_mesh):
-    output = str(tmp_path / "MEMORY.md")
-    count = sync_to_format(populated_mesh, adapter, output)
+def test_export_creates_file(output_path, adapter, populated_mesh):
+    count = sync_to_format(populated_mesh, adapter, str(output_path))
     assert count > 0
-    assert os.path.isfile(output)
+    assert output_path.read_text()
 
 
-def test_export_contains_memories(tmp_path, adapter, populated_mesh):
-    output = str(tmp_path / "MEMORY.md")
-    sync_to_format(populated_mesh, adapter, output)
-    content = (tmp_path / "MEMORY.md").read_text()
-    assert "dual-store" in content
-    assert "dark mode" in content
+def test_export_contains_memories(exported_content):
+    assert "dual-store" in exported_content
+    assert "dark mode" in exported_content
 
 
-def test_export_has_importance_prefix(tmp_path, adapter, populated_mesh):
-    output = str(tmp_path / "MEMORY.md")
-    sync_to_format(populated_mesh, adapter, output)
-    content = (tmp_path / "MEMORY.md").read_text()
-    assert "[importance: 0.90]" in content
+def test_export_has_importance_prefix(exported_content):
+    assert "[importance: 0.90]" in exported_content
 
 
-def test_export_has_header(tmp_path, adapter, populated_mesh):
-    output = str(tmp_path / "MEMORY.md")
-    sync_to_format(populated_mesh, adapter, output)
-    content = (tmp_path / "MEMORY.md").read_text()
-    assert "# Project Memory (synced by MemoryMesh)" in content
+def test_export_has_header(exported_content):
+    assert "# Project Memory (synced by MemoryMesh)" in exported_content
 
 
-def test_export_empty_writes_placeholder(tmp_path, adapter):
-    output = str(tmp_path / "MEMORY.md")
-    m = MemoryMesh(
-        path=str(tmp_path / "p.db"),
-        global_path=str(tmp_path / "g.db"),
-        embedding="none",
-    )
-    memories = m.list()
-    adapter.export_memories(memories, output)
-    m.close()
-    content = (tmp_path / "MEMORY.md").read_text()
+def test_export_empty_writes_placeholder(output_path, adapter, mesh):
+    adapter.export_memories(mesh.list(), str(output_path))
+    content = output_path.read_text()
     assert "No memories stored" in content
 
 
@@ -91,10 +72,9 @@ def test_export_empty_writes_placeholder(tmp_path, adapter):
 # ---------------------------------------------------------------------------
 
 
-def test_import_parses_bullets(tmp_path, adapter):
-    md = tmp_path / "MEMORY.md"
-    md.write_text("# Header\n\n- [importance: 0.85] Decision A\n- Plain text\n")
-    entries = adapter.import_memories(str(md))
+def test_import_parses_bullets(output_path, adapter):
+    output_path.write_text("# Header\n\n- [importance: 0.85] Decision A\n- Plain text\n")
+    entries = adapter.import_memories(str(output_path))
     assert len(entries) == 2
     assert entries[0] == ("Decision A", 0.85, {})
     assert entries[1][0] == "Plain text"
@@ -106,19 +86,21 @@ def test_import_file_not_found(adapter):
         adapter.import_memories("/nonexistent/MEMORY.md")
 
 
-def test_round_trip(tmp_path, adapter, populated_mesh):
+def test_round_trip(output_path, adapter, populated_mesh, mesh):
     """Export then import should recover memories."""
-    output = str(tmp_path / "MEMORY.md")
+    output = str(output_path)
     sync_to_format(populated_mesh, adapter, output)
 
-    mesh2 = MemoryMesh(
-        path=str(tmp_path / "p2.db"),
-        global_path=str(tmp_path / "g2.db"),
-        embedding="none",
-    )
-    count = sync_from_format(mesh2, adapter, output, scope="project")
+    count = sync_from_format(mesh, adapter, output, scope="project")
     assert count >= 2
-    mesh2.close()
+
+
+def test_import_skips_duplicates(output_path, adapter, mesh):
+    """Entries already stored, or repeated within the file, are skipped."""
+    output_path.write_text("- Use SQLite\n- use  sqlite\n- Tests use pytest\n")
+    assert sync_from_format(mesh, adapter, str(output_path), scope="project") == 2
+    assert sync_from_format(mesh, adapter, str(output_path), scope="project") == 0
+    assert mesh.count(scope="project") == 2
 
 
 # ---------------------------------------------------------------------------
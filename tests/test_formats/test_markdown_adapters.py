@@ -0,0 +1,191 @@
+"""Tests shared by the Markdown-section format adapters (Codex and Gemini).
+
+Both adapters write a ``## MemoryMesh Synced Memories`` section into a
+user-owned Markdown file and differ only in the file name, so every test
+here runs once per adapter.  Adapter-specific behaviour lives in
+``test_codex_adapter.py`` and ``test_gemini_adapter.py``.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from memorymesh import MemoryMesh
+from memorymesh.formats import create_format_adapter, sync_from_format, sync_to_format
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module", params=["codex", "gemini"])
+def adapter(request):
+    return create_format_adapter(request.param)
+
+
+@pytest.fixture(scope="module")
+def file_name(adapter):
+    return adapter.file_names[0]
+
+
+@pytest.fixture(scope="module")
+def populated_mesh():
+    # The export tests only read from the mesh, so it is populated once.
+    m = MemoryMesh(path=":memory:", global_path=":memory:", embedding="none")
+    m.remember_many(
+        [
+            {"text": "Architecture uses dual-store pattern", "importance": 0.9, "scope": "project"},
+            {"text": "User prefers dark mode", "importance": 1.0, "scope": "global"},
+            {"text": "Tests use pytest fixtures", "importance": 0.6, "scope": "project"},
+            {"text": "Low importance detail", "importance": 0.3, "scope": "project"},
+        ]
+    )
+    yield m
+    m.close()
+
+
+@pytest.fixture(scope="module")
+def exported_content(adapter, file_name, populated_mesh, tmp_path_factory):
+    # Content-only assertions share a single export per adapter.
+    output = tmp_path_factory.mktemp("export") / file_name
+    sync_to_format(populated_mesh, adapter, str(output))
+    return output.read_text()
+
+
+# ---------------------------------------------------------------------------
+# Export
+# ---------------------------------------------------------------------------
+
+
+def test_export_creates_file(output_path, adapter, populated_mesh):
+    count = sync_to_format(populated_mesh, adapter, str(output_path))
+    assert count > 0
+    assert output_path.is_file()
+
+
+def test_export_content_shape(exported_content):
+    """Export holds the memories in a synced section with hidden importance."""
+    assert "dual-store" in exported_content
+    assert "dark mode" in exported_content
+    assert "## MemoryMesh Synced Memories" in exported_content
+    # Importance travels in HTML comments, never as a visible prefix.
+    assert "<!-- memorymesh:importance=" in exported_content
+    assert "[importance:" not in exported_content
+
+
+def test_export_preserves_existing_content(output_path, adapter, populated_mesh):
+    """Export should preserve user-authored content in the file."""
+    output_path.write_text("# My Project\n\nCustom instructions here.\n")
+
+    sync_to_format(populated_mesh, adapter, str(output_path))
+    content = output_path.read_text()
+
+    assert "# My Project" in content
+    assert "Custom instructions here." in content
+    assert "## MemoryMesh Synced Memories" in content
+
+
+def test_export_replaces_section_on_reexport(output_path, adapter, populated_mesh):
+    """Re-export should replace the section, not duplicate it."""
+    sync_to_format(populated_mesh, adapter, str(output_path))
+    sync_to_format(populated_mesh, adapter, str(output_path))
+
+    content = output_path.read_text()
+    assert content.count("## MemoryMesh Synced Memories") == 1
+
+
+def test_export_empty_returns_zero(output_path, adapter, mesh):
+    assert sync_to_format(mesh, adapter, str(output_path)) == 0
+
+
+# ---------------------------------------------------------------------------
+# Import
+# ---------------------------------------------------------------------------
+
+
+def test_import_parses_bullets(output_path, adapter, file_name):
+    output_path.write_text(
+        f"# {file_name}\n\n"
+        "## MemoryMesh Synced Memories\n\n"
+        "- Use SQLite for storage <!-- memorymesh:importance=0.85 -->\n"
+        "- Plain text bullet\n"
+    )
+    entries = adapter.import_memories(str(output_path))
+    assert len(entries) == 2
+    assert entries[0][0] == "Use SQLite for storage"
+    assert entries[0][1] == 0.85
+    assert entries[1][0] == "Plain text bullet"
+    assert entries[1][1] == 0.5
+
+
+def test_import_skips_headings_and_comments(output_path, adapter):
+    output_path.write_text(
+        "# Header\n## Section\n> Blockquote\n<!-- standalone comment -->\n- Actual memory\n"
+    )
+    entries = adapter.import_memories(str(output_path))
+    assert len(entries) == 1
+    assert entries[0][0] == "Actual memory"
+
+
+def test_import_file_not_found(adapter, file_name):
+    with pytest.raises(FileNotFoundError):
+        adapter.import_memories(f"/nonexistent/{file_name}")
+
+
+def test_round_trip(output_path, adapter, populated_mesh, mesh):
+    """Export then import should recover memories with correct importance."""
+    sync_to_format(populated_mesh, adapter, str(output_path))
+
+    count = sync_from_format(mesh, adapter, str(output_path), scope="project")
+    assert count >= 2
+
+    # Check that importance was preserved via HTML comments.
+    importances = {round(i, 2) for (i,) in mesh.iter_memories(("importance",), scope="project")}
+    assert 0.9 in importances or 1.0 in importances
+
+
+# ---------------------------------------------------------------------------
+# Detection
+# ---------------------------------------------------------------------------
+
+
+def test_detect_project_path(tmp_path, output_path, adapter):
+    assert adapter.detect_project_path(str(tmp_path)) == str(output_path)
+
+
+def test_is_installed(adapter):
+    result = adapter.is_installed()
+    assert isinstance(result, bool)
+
+
+# ---------------------------------------------------------------------------
+# Init
+# ---------------------------------------------------------------------------
+
+
+def test_init_creates_file(tmp_path, output_path, adapter):
+    messages = adapter.init_project(str(tmp_path))
+    assert len(messages) > 0
+
+    assert output_path.exists()
+    content = output_path.read_text()
+    assert "## MemoryMesh Synced Memories" in content
+
+
+def test_init_appends_to_existing(tmp_path, output_path, adapter):
+    output_path.write_text("# Existing config\n\nUser instructions.\n")
+
+    adapter.init_project(str(tmp_path))
+    content = output_path.read_text()
+    assert "# Existing config" in content
+    assert "User instructions." in content
+    assert "## MemoryMesh Synced Memories" in content
+
+
+def test_init_idempotent(tmp_path, output_path, adapter):
+    adapter.init_project(str(tmp_path))
+    messages = adapter.init_project(str(tmp_path))
+    assert any("already present" in m for m in messages)
+
+    content = output_path.read_text()
+    assert content.count("## MemoryMesh Synced Memories") == 1
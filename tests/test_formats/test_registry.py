@@ -47,6 +47,13 @@ def test_get_all_adapters():
     assert "gemini" in names
 
 
+def test_adapters_are_shared_instances():
+    codex = create_format_adapter("codex")
+    assert create_format_adapter("codex") is codex
+    assert any(a is codex for a in get_all_adapters())
+    assert get_all_adapters() is not get_all_adapters()
+
+
 def test_get_format_names():
     names = get_format_names()
     assert "claude" in names
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from memorymesh.formats._shared import (
+    build_duplicate_index,
     importance_to_html_comment,
     inject_section,
     is_duplicate,
+    is_duplicate_indexed,
     normalise,
     parse_importance_from_html_comment,
     parse_importance_prefix,
@@ -58,6 +60,13 @@ def test_is_duplicate_empty_candidates():
     assert not is_duplicate("anything", [])
 
 
+def test_is_duplicate_indexed_matches_normalised_text():
+    index = build_duplicate_index([Memory(text="Use  SQLite   for storage")])
+    assert index == {"use sqlite for storage"}
+    assert is_duplicate_indexed("Use SQLite For Storage", index)
+    assert not is_duplicate_indexed("Use PostgreSQL", index)
+
+
 # ---------------------------------------------------------------------------
 # HTML comment helpers
 # ---------------------------------------------------------------------------
@@ -85,6 +94,13 @@ def test_parse_importance_no_comment():
     assert imp == 0.5
 
 
+def test_parse_importance_other_comment_kept():
+    line = "  Use SQLite <!-- reviewed -->  "
+    text, imp = parse_importance_from_html_comment(line)
+    assert text == "Use SQLite <!-- reviewed -->"
+    assert imp == 0.5
+
+
 def test_parse_importance_clamped():
     line = "text <!-- memorymesh:importance=1.50 -->"
     _text, imp = parse_importance_from_html_comment(line)
@@ -157,3 +173,9 @@ def test_inject_section_preserves_content_above_and_below():
     assert "After content." in result
     assert "- replaced" in result
     assert "- old" not in result
+
+
+def test_inject_section_stops_at_level_one_heading():
+    existing = "# Title\n\n## MemoryMesh Synced Memories\n\n- old\n\n# Appendix\n\nKept.\n"
+    result = inject_section(existing, "## MemoryMesh Synced Memories\n\n- new")
+    assert result == "# Title\n\n## MemoryMesh Synced Memories\n\n- new\n\n# Appendix\n\nKept.\n"
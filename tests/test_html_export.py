@@ -6,7 +6,7 @@ with correct content, XSS protection, and all expected UI elements.
 
 from __future__ import annotations
 
-from memorymesh.html_export import generate_html
+from memorymesh.html_export import generate_html, generate_html_to_file
 from memorymesh.memory import Memory
 
 # ---------------------------------------------------------------------------
@@ -14,6 +14,11 @@ from memorymesh.memory import Memory
 # ---------------------------------------------------------------------------
 
 
+# Shared by every memory built without metadata.  generate_html only reads
+# metadata, so tests must never mutate it.
+_EMPTY_META: dict = {}
+
+
 def _make_memory(
     text: str = "Test memory",
     scope: str = "project",
@@ -26,11 +31,20 @@ def _make_memory(
         text=text,
         scope=scope,
         importance=importance,
-        metadata=metadata or {},
+        metadata=metadata if metadata is not None else _EMPTY_META,
         access_count=access_count,
     )
 
 
+def _assert_in_order(html: str, *needles: str) -> None:
+    """Assert each needle occurs in *html* after the previous one."""
+    idx = 0
+    for needle in needles:
+        idx = html.find(needle, idx)
+        assert idx != -1, f"{needle!r} missing or out of order"
+        idx += len(needle)
+
+
 # ---------------------------------------------------------------------------
 # Basic structure
 # ---------------------------------------------------------------------------
@@ -39,11 +53,7 @@ def _make_memory(
 def test_generates_valid_html():
     """Output is a complete HTML document."""
     html = generate_html([])
-    assert "<!DOCTYPE html>" in html
-    assert "<html" in html
-    assert "</html>" in html
-    assert "<head>" in html
-    assert "<body>" in html
+    _assert_in_order(html, "<!DOCTYPE html>", "<html", "<head>", "</head>", "<body>", "</html>")
 
 
 def test_title_in_output():
@@ -163,6 +173,14 @@ def test_xss_in_metadata():
     assert "&lt;img" in html
 
 
+def test_quotes_escaped_only_in_attributes():
+    """Memory text keeps its quotes in the body but not in the data attribute."""
+    mem = _make_memory(text='say "hi"')
+    html = generate_html([mem])
+    assert 'data-text="say &quot;hi&quot;"' in html
+    assert '<pre class="mem-text">say "hi"</pre>' in html
+
+
 def test_xss_in_title():
     """Script tags in the title are escaped."""
     html = generate_html([], title='<script>alert("title")</script>')
@@ -178,8 +196,7 @@ def test_xss_in_title():
 def test_inline_css():
     """CSS is embedded inline (no external stylesheet links)."""
     html = generate_html([])
-    assert "<style>" in html
-    assert "prefers-color-scheme: dark" in html
+    _assert_in_order(html, "<style>", "prefers-color-scheme: dark", "</style>")
     # No external CSS links
     assert '<link rel="stylesheet"' not in html
 
@@ -187,13 +204,9 @@ def test_inline_css():
 def test_inline_js():
     """JavaScript is embedded inline (no external script sources)."""
     html = generate_html([])
-    assert "<script>" in html
-    # No external script tags
-    assert (
-        "src=" not in html.split("<script>")[0].split("</script>")[0]
-        if "<script>" in html
-        else True
-    )
+    _assert_in_order(html, "<script>", "</script>", "</body>")
+    # Every script tag is a bare inline one, never <script src=...>.
+    assert html.count("<script") == html.count("<script>") == 1
 
 
 def test_search_box():
@@ -207,3 +220,11 @@ def test_responsive_viewport():
     """Viewport meta tag is present for mobile responsiveness."""
     html = generate_html([])
     assert 'name="viewport"' in html
+
+
+def test_generate_html_to_file_matches_string(tmp_path):
+    """Streaming to a file produces the same document as generate_html."""
+    mems = [_make_memory(text="first"), _make_memory(text="second", scope="global")]
+    out = tmp_path / "export.html"
+    generate_html_to_file(str(out), mems, title="T", project_path="/p")
+    assert out.read_text(encoding="utf-8") == generate_html(mems, title="T", project_path="/p")
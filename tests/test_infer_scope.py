@@ -2,10 +2,6 @@
 
 from __future__ import annotations
 
-import os
-import tempfile
-from collections.abc import Generator
-
 import pytest
 
 from memorymesh.categories import infer_scope
@@ -19,83 +15,61 @@ from memorymesh.core import MemoryMesh
 class TestInferScopeUserSubject:
     """Text about the user should infer global scope."""
 
-    def test_user_prefers(self) -> None:
-        assert infer_scope("User prefers dark mode in all editors") == "global"
-
-    def test_user_likes(self) -> None:
-        assert infer_scope("User likes functional programming style") == "global"
-
-    def test_user_always(self) -> None:
-        assert infer_scope("User always runs tests before committing") == "global"
-
-    def test_possessive_name_pattern(self) -> None:
-        assert infer_scope("Krishna's patterns: asks questions before acting") == "global"
-
-    def test_possessive_name_workflow(self) -> None:
-        assert infer_scope("Alice's workflow: review PR, then merge") == "global"
-
-    def test_across_all_projects(self) -> None:
-        assert infer_scope("This preference applies across all projects") == "global"
-
-    def test_interaction_pattern(self) -> None:
-        assert infer_scope("Interaction pattern: prefers speed once decided") == "global"
-
-    def test_communication_style(self) -> None:
-        assert infer_scope("Communication style: concise, direct, no fluff") == "global"
-
-    def test_coding_style(self) -> None:
-        assert infer_scope("Coding style: functional over OOP when possible") == "global"
-
-    def test_personal_preference(self) -> None:
-        assert infer_scope("Personal preference: always use type hints") == "global"
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "User prefers dark mode in all editors",
+            "User likes functional programming style",
+            "User always runs tests before committing",
+            "Krishna's patterns: asks questions before acting",
+            "Alice's workflow: review PR, then merge",
+            "This preference applies across all projects",
+            "Interaction pattern: prefers speed once decided",
+            "Communication style: concise, direct, no fluff",
+            "Coding style: functional over OOP when possible",
+            # IGNORECASE also matches the long s; the prefilter must not miss it.
+            "USER PREFERS tabs, and the u\u017fer hates spaces",
+            "Personal preference: always use type hints",
+        ],
+    )
+    def test_infers_global(self, text: str) -> None:
+        assert infer_scope(text) == "global"
 
 
 class TestInferScopeProjectSubject:
     """Text about the project should infer project scope."""
 
-    def test_file_path(self) -> None:
-        assert infer_scope("Entry point is src/memorymesh/core.py") == "project"
-
-    def test_test_path(self) -> None:
-        assert infer_scope("Tests are in tests/ directory") == "project"
-
-    def test_pyproject_toml(self) -> None:
-        assert infer_scope("pyproject.toml configured with hatchling") == "project"
-
-    def test_implementation_state(self) -> None:
-        assert infer_scope("Implementation state (2026-02-17): Phase 1 complete") == "project"
-
-    def test_version_date(self) -> None:
-        assert infer_scope("v0.1.0 released 2026-02-16") == "project"
-
-    def test_tests_passing(self) -> None:
-        assert infer_scope("633 tests pass, 3 skipped, ruff clean") == "project"
-
-    def test_commit_hash(self) -> None:
-        assert infer_scope("Committed as commit 4fb7df3 on main") == "project"
-
-    def test_python_file(self) -> None:
-        assert infer_scope("Modified core.py to add update method") == "project"
-
-    def test_product_name_match(self) -> None:
-        result = infer_scope(
-            "MemoryMesh is an embeddable AI memory library",
-            project_name="MemoryMesh",
-        )
-        assert result == "project"
+    @pytest.mark.parametrize(
+        ("text", "project_name"),
+        [
+            ("Entry point is src/memorymesh/core.py", None),
+            ("Tests are in tests/ directory", None),
+            ("pyproject.toml configured with hatchling", None),
+            ("Implementation state (2026-02-17): Phase 1 complete", None),
+            ("v0.1.0 released 2026-02-16", None),
+            ("633 tests pass, 3 skipped, ruff clean", None),
+            ("Committed as commit 4fb7df3 on main", None),
+            ("Modified core.py to add update method", None),
+            ("MemoryMesh is an embeddable AI memory library", "MemoryMesh"),
+        ],
+    )
+    def test_infers_project(self, text: str, project_name: str | None) -> None:
+        assert infer_scope(text, project_name=project_name) == "project"
 
 
 class TestInferScopeNoSignal:
     """Ambiguous text should return None."""
 
-    def test_generic_text(self) -> None:
-        assert infer_scope("SQLite uses WAL mode for concurrency") is None
-
-    def test_short_text(self) -> None:
-        assert infer_scope("Important decision made") is None
-
-    def test_empty_text(self) -> None:
-        assert infer_scope("") is None
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "SQLite uses WAL mode for concurrency",
+            "Important decision made",
+            "",
+        ],
+    )
+    def test_infers_none(self, text: str) -> None:
+        assert infer_scope(text) is None
 
 
 class TestInferScopeConflictResolution:
@@ -125,21 +99,6 @@ class TestInferScopeConflictResolution:
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def tmp_dir():
-    with tempfile.TemporaryDirectory() as d:
-        yield d
-
-
-@pytest.fixture
-def mesh(tmp_dir: str) -> Generator[MemoryMesh, None, None]:
-    db_path = os.path.join(tmp_dir, "project.db")
-    global_path = os.path.join(tmp_dir, "global.db")
-    m = MemoryMesh(path=db_path, global_path=global_path, embedding="none")
-    yield m
-    m.close()
-
-
 class TestRememberScopeInference:
     """remember() should auto-infer scope when not explicitly provided."""
 
@@ -7,8 +7,8 @@ and CLAUDE.md injection.
 from __future__ import annotations
 
 import json
-import os
 
+from memorymesh.cli import main
 from memorymesh.init_cmd import run_init
 
 
@@ -70,9 +70,8 @@ def test_init_configures_mcp(tmp_path, monkeypatch, capsys):
     """init writes MCP server config to ~/.claude/settings.json."""
     fake_home = tmp_path / "home"
     fake_home.mkdir()
+    # No home_dir: the default path comes from expanduser("~"), i.e. $HOME.
     monkeypatch.setenv("HOME", str(fake_home))
-    # Patch expanduser to use fake home
-    monkeypatch.setattr(os.path, "expanduser", lambda p: p.replace("~", str(fake_home)))
 
     project_dir = tmp_path / "project"
     project_dir.mkdir()
@@ -88,7 +87,7 @@ def test_init_configures_mcp(tmp_path, monkeypatch, capsys):
     assert config["mcpServers"]["memorymesh"]["command"] == "memorymesh-mcp"
 
 
-def test_init_merges_existing_mcp_config(tmp_path, monkeypatch, capsys):
+def test_init_merges_existing_mcp_config(tmp_path, capsys):
     """init merges into existing MCP config without destroying other servers."""
     fake_home = tmp_path / "home"
     claude_dir = fake_home / ".claude"
@@ -97,12 +96,16 @@ def test_init_merges_existing_mcp_config(tmp_path, monkeypatch, capsys):
     config_path.write_text(
         json.dumps({"mcpServers": {"other-server": {"command": "other-cmd", "args": []}}})
     )
-    monkeypatch.setattr(os.path, "expanduser", lambda p: p.replace("~", str(fake_home)))
 
     project_dir = tmp_path / "project"
     project_dir.mkdir()
 
-    rc = run_init(project_path=str(project_dir), skip_mcp=False, skip_claude_md=True)
+    rc = run_init(
+        project_path=str(project_dir),
+        skip_mcp=False,
+        skip_claude_md=True,
+        home_dir=str(fake_home),
+    )
     assert rc == 0
 
     config = json.loads(config_path.read_text())
@@ -123,8 +126,6 @@ def test_init_no_project_root(tmp_path, monkeypatch, capsys):
 
 def test_init_via_cli(tmp_path, capsys):
     """init works through the main CLI entry point."""
-    from memorymesh.cli import main
-
     rc = main(["init", "--project-path", str(tmp_path), "--skip-mcp", "--skip-claude-md"])
     assert rc == 0
     assert (tmp_path / ".memorymesh").is_dir()
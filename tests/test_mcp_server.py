@@ -6,9 +6,10 @@ dispatch & guards, response helpers, factory methods, and edge cases.
 
 from __future__ import annotations
 
+import io
 import json
 import os
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from typing import Any
 from unittest.mock import patch
 
@@ -30,6 +31,19 @@ from memorymesh.mcp_server import (
 # Helpers
 # ------------------------------------------------------------------
 
+# Limit-sized inputs are built once and shared by the validation tests.
+_EXACT_TEXT = "a" * MAX_TEXT_LENGTH
+_OVERSIZED_TEXT = _EXACT_TEXT + "a"
+_OVERSIZED_META = {"big": "x" * MAX_METADATA_SIZE}
+
+# Environment for tests that let the server build its own mesh but do not
+# care where it lives: both stores stay in memory, away from ``~``.
+_IN_MEMORY_ENV = {
+    "MEMORYMESH_PATH": ":memory:",
+    "MEMORYMESH_GLOBAL_PATH": ":memory:",
+    "MEMORYMESH_EMBEDDING": "none",
+}
+
 
 def _call_tool(server: MemoryMeshMCPServer, name: str, args: dict[str, Any] | None = None) -> dict:
     """Shorthand for calling a tool through _handle_tools_call."""
@@ -42,6 +56,12 @@ def _get_result_data(response: dict[str, Any]) -> dict[str, Any]:
     return json.loads(text)
 
 
+def _written_message(server: MemoryMeshMCPServer) -> dict[str, Any] | None:
+    """Parse the JSON-RPC message a ``buffered_server`` wrote, if any."""
+    text = server._out.getvalue()  # type: ignore[union-attr]
+    return json.loads(text) if text else None
+
+
 def _is_error(response: dict[str, Any]) -> bool:
     """Check whether the response has the isError flag."""
     return response.get("isError", False) is True
@@ -58,31 +78,83 @@ def _get_error_message(response: dict[str, Any]) -> str:
 # ------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def server(shared_mesh: MemoryMesh) -> MemoryMeshMCPServer:
+    """An initialized MCP server with an injected mesh."""
+    return MemoryMeshMCPServer(mesh=shared_mesh, client_name="test-client")
+
+
 @pytest.fixture
-def mesh(tmp_path) -> Generator[MemoryMesh, None, None]:
-    """A real MemoryMesh with project + global stores, no embeddings."""
-    m = MemoryMesh(
-        path=tmp_path / "project.db",
-        global_path=tmp_path / "global.db",
-        embedding="none",
-    )
-    yield m
-    m.close()
+def buffered_server(mesh: MemoryMesh) -> MemoryMeshMCPServer:
+    """An initialized MCP server that writes responses to a StringIO."""
+    return MemoryMeshMCPServer(mesh=mesh, out=io.StringIO(), client_name="test-client")
 
 
 @pytest.fixture
-def server(mesh: MemoryMesh) -> MemoryMeshMCPServer:
-    """An initialized MCP server with an injected mesh."""
-    s = MemoryMeshMCPServer(mesh=mesh)
-    s._initialized = True
-    s._client_name = "test-client"
-    return s
+def memory_id(mesh: MemoryMesh) -> str:
+    """ID of a project memory stored straight on the shared mesh."""
+    return mesh.remember("seed memory", scope="project")
+
+
+@pytest.fixture(autouse=True)
+def _reset(request: pytest.FixtureRequest) -> None:
+    """Restore the shared server before each test that uses it.
+
+    Requesting ``mesh`` here also empties the shared mesh afterwards.
+    """
+    if "server" in request.fixturenames:
+        s = request.getfixturevalue("server")
+        s._mesh = request.getfixturevalue("mesh")
+        s._initialized = True
+        s._project_root = None
+        s._detection_diagnostics = ()
 
 
 @pytest.fixture
-def uninitialized_server() -> MemoryMeshMCPServer:
+def uninitialized_server() -> Generator[MemoryMeshMCPServer, None, None]:
     """A bare MCP server with no mesh and not initialized."""
-    return MemoryMeshMCPServer()
+    s = MemoryMeshMCPServer()
+    yield s
+    if s._mesh is not None:
+        s._mesh.close()
+
+
+@pytest.fixture
+def track_mesh() -> Generator[Callable[[MemoryMesh], MemoryMesh], None, None]:
+    """Register meshes a test builds itself so they close even if it fails."""
+    meshes: list[MemoryMesh] = []
+
+    def _track(m: MemoryMesh) -> MemoryMesh:
+        meshes.append(m)
+        return m
+
+    yield _track
+    for m in meshes:
+        m.close()
+
+
+@pytest.fixture(scope="class")
+def in_memory_env() -> Generator[None, None, None]:
+    """Apply :data:`_IN_MEMORY_ENV` once for a whole test class."""
+    with pytest.MonkeyPatch.context() as mp:
+        for name, value in _IN_MEMORY_ENV.items():
+            mp.setenv(name, value)
+        yield
+
+
+@pytest.fixture(scope="class")
+def initialized(
+    in_memory_env: None,
+) -> Generator[tuple[MemoryMeshMCPServer, dict[str, Any]], None, None]:
+    """A server after one bare ``initialize``, with the handler's result.
+
+    Shared by a test class, so tests must only inspect it.
+    """
+    s = MemoryMeshMCPServer()
+    result = s._handle_initialize({})
+    yield s, result
+    if s._mesh is not None:
+        s._mesh.close()
 
 
 # ==================================================================
@@ -116,7 +188,7 @@ class TestServerConstructor:
     def test_with_mesh(self, mesh: MemoryMesh) -> None:
         s = MemoryMeshMCPServer(mesh=mesh)
         assert s._mesh is mesh
-        assert s._initialized is False
+        assert s._initialized is True
 
     def test_without_mesh(self) -> None:
         s = MemoryMeshMCPServer()
@@ -145,26 +217,18 @@ class TestResponseHelpers:
         data = json.loads(resp["content"][0]["text"])
         assert data["error"] == "bad input"
 
-    def test_send_result_writes_jsonrpc(self, server: MemoryMeshMCPServer) -> None:
-        """_send_result writes valid JSON-RPC to stdout."""
-        import io
-
-        buf = io.StringIO()
-        with patch("sys.stdout", buf):
-            server._send_result(42, {"ok": True})
-        msg = json.loads(buf.getvalue().strip())
+    def test_send_result_writes_jsonrpc(self, buffered_server: MemoryMeshMCPServer) -> None:
+        """_send_result writes valid JSON-RPC to the output stream."""
+        buffered_server._send_result(42, {"ok": True})
+        msg = _written_message(buffered_server)
         assert msg["jsonrpc"] == "2.0"
         assert msg["id"] == 42
         assert msg["result"]["ok"] is True
 
-    def test_send_error_writes_jsonrpc(self, server: MemoryMeshMCPServer) -> None:
-        """_send_error writes valid JSON-RPC error to stdout."""
-        import io
-
-        buf = io.StringIO()
-        with patch("sys.stdout", buf):
-            server._send_error(7, -32600, "bad request")
-        msg = json.loads(buf.getvalue().strip())
+    def test_send_error_writes_jsonrpc(self, buffered_server: MemoryMeshMCPServer) -> None:
+        """_send_error writes valid JSON-RPC error to the output stream."""
+        buffered_server._send_error(7, -32600, "bad request")
+        msg = _written_message(buffered_server)
         assert msg["jsonrpc"] == "2.0"
         assert msg["id"] == 7
         assert msg["error"]["code"] == -32600
@@ -193,8 +257,7 @@ class TestToolRememberValidation:
         assert _is_error(resp)
 
     def test_max_length_text(self, server: MemoryMeshMCPServer) -> None:
-        long_text = "a" * (MAX_TEXT_LENGTH + 1)
-        resp = _call_tool(server, "remember", {"text": long_text})
+        resp = _call_tool(server, "remember", {"text": _OVERSIZED_TEXT})
         assert _is_error(resp)
         assert "maximum length" in _get_error_message(resp).lower()
 
@@ -209,11 +272,16 @@ class TestToolRememberValidation:
         assert "metadata" in _get_error_message(resp).lower()
 
     def test_oversized_metadata(self, server: MemoryMeshMCPServer) -> None:
-        big_meta = {"key": "x" * MAX_METADATA_SIZE}
-        resp = _call_tool(server, "remember", {"text": "ok", "metadata": big_meta})
+        resp = _call_tool(server, "remember", {"text": "ok", "metadata": _OVERSIZED_META})
         assert _is_error(resp)
         assert "metadata" in _get_error_message(resp).lower()
 
+    def test_metadata_at_limit_accepted(self, server: MemoryMeshMCPServer) -> None:
+        """The limit applies to metadata serialised as the store writes it."""
+        meta = {"k": "x" * (MAX_METADATA_SIZE - len('{"k": ""}'))}
+        resp = _call_tool(server, "remember", {"text": "ok", "metadata": meta})
+        assert not _is_error(resp)
+
     def test_invalid_scope(self, server: MemoryMeshMCPServer) -> None:
         resp = _call_tool(server, "remember", {"text": "ok", "scope": "invalid"})
         assert _is_error(resp)
@@ -236,8 +304,7 @@ class TestToolRememberValidation:
 
     def test_exact_max_length_accepted(self, server: MemoryMeshMCPServer) -> None:
         """Text at exactly MAX_TEXT_LENGTH should be accepted."""
-        exact_text = "a" * MAX_TEXT_LENGTH
-        resp = _call_tool(server, "remember", {"text": exact_text})
+        resp = _call_tool(server, "remember", {"text": _EXACT_TEXT})
         assert not _is_error(resp)
 
 
@@ -291,12 +358,8 @@ class TestToolForget:
         resp = _call_tool(server, "forget", {"memory_id": 123})
         assert _is_error(resp)
 
-    def test_existing_memory(self, server: MemoryMeshMCPServer) -> None:
-        # First remember something
-        resp = _call_tool(server, "remember", {"text": "to forget"})
-        mid = _get_result_data(resp)["memory_id"]
-
-        resp = _call_tool(server, "forget", {"memory_id": mid})
+    def test_existing_memory(self, server: MemoryMeshMCPServer, memory_id: str) -> None:
+        resp = _call_tool(server, "forget", {"memory_id": memory_id})
         assert not _is_error(resp)
         data = _get_result_data(resp)
         assert data["deleted"] is True
@@ -311,26 +374,16 @@ class TestToolForget:
 class TestToolForgetAll:
     """Validation and behaviour for the forget_all tool."""
 
-    def test_defaults_to_project_scope(self, server: MemoryMeshMCPServer) -> None:
-        _call_tool(server, "remember", {"text": "project mem", "scope": "project"})
-        resp = _call_tool(server, "forget_all", {})
-        assert not _is_error(resp)
-        data = _get_result_data(resp)
-        assert data["scope"] == "project"
-
-    def test_project_scope(self, server: MemoryMeshMCPServer) -> None:
-        _call_tool(server, "remember", {"text": "p1", "scope": "project"})
-        resp = _call_tool(server, "forget_all", {"scope": "project"})
-        assert not _is_error(resp)
-        data = _get_result_data(resp)
-        assert data["scope"] == "project"
-
-    def test_global_scope(self, server: MemoryMeshMCPServer) -> None:
-        _call_tool(server, "remember", {"text": "g1", "scope": "global"})
-        resp = _call_tool(server, "forget_all", {"scope": "global"})
+    @pytest.mark.parametrize(
+        ("args", "expected"),
+        [({}, "project"), ({"scope": "project"}, "project"), ({"scope": "global"}, "global")],
+    )
+    def test_scope(self, server: MemoryMeshMCPServer, args: dict, expected: str) -> None:
+        _call_tool(server, "remember", {"text": f"{expected} mem", "scope": expected})
+        resp = _call_tool(server, "forget_all", args)
         assert not _is_error(resp)
         data = _get_result_data(resp)
-        assert data["scope"] == "global"
+        assert data["scope"] == expected
 
     def test_invalid_scope(self, server: MemoryMeshMCPServer) -> None:
         resp = _call_tool(server, "forget_all", {"scope": "invalid"})
@@ -353,67 +406,46 @@ class TestToolUpdateMemoryValidation:
         assert _is_error(resp)
         assert "not found" in _get_error_message(resp).lower()
 
-    def test_update_text(self, server: MemoryMeshMCPServer) -> None:
-        resp = _call_tool(server, "remember", {"text": "original"})
-        mid = _get_result_data(resp)["memory_id"]
-
-        resp = _call_tool(server, "update_memory", {"memory_id": mid, "text": "updated"})
+    def test_update_text(self, server: MemoryMeshMCPServer, memory_id: str) -> None:
+        resp = _call_tool(server, "update_memory", {"memory_id": memory_id, "text": "updated"})
         assert not _is_error(resp)
         data = _get_result_data(resp)
-        assert data["memory_id"] == mid
+        assert data["memory_id"] == memory_id
         assert "updated" in data["message"].lower()
 
-    def test_update_importance(self, server: MemoryMeshMCPServer) -> None:
-        resp = _call_tool(server, "remember", {"text": "test imp"})
-        mid = _get_result_data(resp)["memory_id"]
-
-        resp = _call_tool(server, "update_memory", {"memory_id": mid, "importance": 0.9})
+    def test_update_importance(self, server: MemoryMeshMCPServer, memory_id: str) -> None:
+        resp = _call_tool(server, "update_memory", {"memory_id": memory_id, "importance": 0.9})
         assert not _is_error(resp)
         data = _get_result_data(resp)
         assert data["importance"] == 0.9
 
-    def test_update_scope(self, server: MemoryMeshMCPServer) -> None:
-        resp = _call_tool(server, "remember", {"text": "scope test", "scope": "project"})
-        mid = _get_result_data(resp)["memory_id"]
-
-        resp = _call_tool(server, "update_memory", {"memory_id": mid, "scope": "global"})
+    def test_update_scope(self, server: MemoryMeshMCPServer, memory_id: str) -> None:
+        resp = _call_tool(server, "update_memory", {"memory_id": memory_id, "scope": "global"})
         assert not _is_error(resp)
         data = _get_result_data(resp)
         assert data["scope"] == "global"
 
-    def test_update_metadata(self, server: MemoryMeshMCPServer) -> None:
-        resp = _call_tool(server, "remember", {"text": "meta test"})
-        mid = _get_result_data(resp)["memory_id"]
-
+    def test_update_metadata(self, server: MemoryMeshMCPServer, memory_id: str) -> None:
         resp = _call_tool(
-            server, "update_memory", {"memory_id": mid, "metadata": {"tag": "updated"}}
+            server, "update_memory", {"memory_id": memory_id, "metadata": {"tag": "updated"}}
         )
         assert not _is_error(resp)
 
-    def test_empty_text_rejected(self, server: MemoryMeshMCPServer) -> None:
-        resp = _call_tool(server, "remember", {"text": "nonempty"})
-        mid = _get_result_data(resp)["memory_id"]
-
-        resp = _call_tool(server, "update_memory", {"memory_id": mid, "text": ""})
+    def test_empty_text_rejected(self, server: MemoryMeshMCPServer, memory_id: str) -> None:
+        resp = _call_tool(server, "update_memory", {"memory_id": memory_id, "text": ""})
         assert _is_error(resp)
 
-    def test_oversized_text(self, server: MemoryMeshMCPServer) -> None:
-        resp = _call_tool(server, "remember", {"text": "ok"})
-        mid = _get_result_data(resp)["memory_id"]
-
+    def test_oversized_text(self, server: MemoryMeshMCPServer, memory_id: str) -> None:
         resp = _call_tool(
-            server, "update_memory", {"memory_id": mid, "text": "a" * (MAX_TEXT_LENGTH + 1)}
+            server, "update_memory", {"memory_id": memory_id, "text": _OVERSIZED_TEXT}
         )
         assert _is_error(resp)
 
-    def test_oversized_metadata(self, server: MemoryMeshMCPServer) -> None:
-        resp = _call_tool(server, "remember", {"text": "ok"})
-        mid = _get_result_data(resp)["memory_id"]
-
+    def test_oversized_metadata(self, server: MemoryMeshMCPServer, memory_id: str) -> None:
         resp = _call_tool(
             server,
             "update_memory",
-            {"memory_id": mid, "metadata": {"big": "x" * MAX_METADATA_SIZE}},
+            {"memory_id": memory_id, "metadata": _OVERSIZED_META},
         )
         assert _is_error(resp)
 
@@ -514,9 +546,9 @@ class TestToolRecallHappyPath:
         assert "access_count" in mem
         assert "created_at" in mem
 
-    def test_default_k(self, server: MemoryMeshMCPServer) -> None:
-        for i in range(10):
-            _call_tool(server, "remember", {"text": f"keyword memory {i}"})
+    def test_default_k(self, server: MemoryMeshMCPServer, mesh: MemoryMesh) -> None:
+        # Only recall is under test, so seed the store in one transaction.
+        mesh.remember_many([{"text": f"keyword memory {i}"} for i in range(10)])
         resp = _call_tool(server, "recall", {"query": "keyword memory"})
         data = _get_result_data(resp)
         assert data["count"] <= 5  # default k=5
@@ -553,9 +585,8 @@ class TestToolMemoryStats:
         data = _get_result_data(resp)
         assert data["total_memories"] == 0
 
-    def test_with_memories(self, server: MemoryMeshMCPServer) -> None:
-        _call_tool(server, "remember", {"text": "stat mem 1"})
-        _call_tool(server, "remember", {"text": "stat mem 2"})
+    def test_with_memories(self, server: MemoryMeshMCPServer, mesh: MemoryMesh) -> None:
+        mesh.remember_many([{"text": "stat mem 1"}, {"text": "stat mem 2"}])
         resp = _call_tool(server, "memory_stats", {})
         data = _get_result_data(resp)
         assert data["total_memories"] >= 2
@@ -589,19 +620,13 @@ class TestToolSessionStart:
         assert data["store_health"]["global_store"] == "ok"
         assert data["store_health"]["project_store"] == "ok"
 
-    def test_store_health_without_project(self, tmp_path) -> None:
+    def test_store_health_without_project(self, track_mesh) -> None:
         """When no project store is configured, report not_configured."""
-        m = MemoryMesh(
-            global_path=tmp_path / "global.db",
-            embedding="none",
-        )
-        s = MemoryMeshMCPServer(mesh=m)
-        s._initialized = True
-        s._client_name = "test"
+        m = track_mesh(MemoryMesh(global_path=":memory:", embedding="none"))
+        s = MemoryMeshMCPServer(mesh=m, client_name="test")
         resp = _call_tool(s, "session_start", {})
         data = _get_result_data(resp)
         assert data["store_health"]["project_store"] == "not_configured"
-        m.close()
 
     def test_project_context_forwarded(self, server: MemoryMeshMCPServer) -> None:
         """project_context param should be forwarded to mesh.session_start."""
@@ -650,17 +675,12 @@ class TestToolStatus:
         assert data["project_store"]["status"] == "ok"
         assert "path" in data["project_store"]
 
-    def test_project_not_configured(self, tmp_path) -> None:
-        m = MemoryMesh(
-            global_path=tmp_path / "global.db",
-            embedding="none",
-        )
+    def test_project_not_configured(self, track_mesh) -> None:
+        m = track_mesh(MemoryMesh(global_path=":memory:", embedding="none"))
         s = MemoryMeshMCPServer(mesh=m)
-        s._initialized = True
         resp = _call_tool(s, "status", {})
         data = _get_result_data(resp)
         assert data["project_store"]["status"] == "not_configured"
-        m.close()
 
     def test_global_store_ok(self, server: MemoryMeshMCPServer) -> None:
         resp = _call_tool(server, "status", {})
@@ -671,14 +691,23 @@ class TestToolStatus:
 class TestToolConfigureProject:
     """Tests for the configure_project tool."""
 
-    def test_valid_path(self, server: MemoryMeshMCPServer, tmp_path) -> None:
+    def test_valid_path(self, tmp_path) -> None:
+        # configure_project closes the current mesh, so use a private one.
+        s = MemoryMeshMCPServer(
+            mesh=MemoryMesh(path=":memory:", global_path=":memory:", embedding="none"),
+            client_name="test-client",
+        )
         project_dir = tmp_path / "myproject"
         project_dir.mkdir()
-        resp = _call_tool(server, "configure_project", {"path": str(project_dir)})
+        env = {"MEMORYMESH_GLOBAL_PATH": ":memory:", "MEMORYMESH_EMBEDDING": "none"}
+        with patch.dict(os.environ, env, clear=False):
+            resp = _call_tool(s, "configure_project", {"path": str(project_dir)})
         assert not _is_error(resp)
         data = _get_result_data(resp)
         assert "project_root" in data
         assert "project_db" in data
+        assert s._mesh is not None
+        s._mesh.close()
 
     def test_missing_path(self, server: MemoryMeshMCPServer) -> None:
         resp = _call_tool(server, "configure_project", {})
@@ -706,45 +735,36 @@ class TestToolConfigureProject:
 # ==================================================================
 
 
+@pytest.mark.usefixtures("in_memory_env")
 class TestHandleInitialize:
     """Tests for the initialize protocol handler."""
 
-    def test_protocol_version(self, uninitialized_server: MemoryMeshMCPServer, tmp_path) -> None:
-        with patch.dict(os.environ, {"MEMORYMESH_PATH": str(tmp_path / "p.db")}):
-            result = uninitialized_server._handle_initialize({})
+    def test_protocol_version(self, initialized: tuple[MemoryMeshMCPServer, dict]) -> None:
+        _, result = initialized
         assert result["protocolVersion"] == "2024-11-05"
 
-    def test_capabilities(self, uninitialized_server: MemoryMeshMCPServer, tmp_path) -> None:
-        with patch.dict(os.environ, {"MEMORYMESH_PATH": str(tmp_path / "p.db")}):
-            result = uninitialized_server._handle_initialize({})
+    def test_capabilities(self, initialized: tuple[MemoryMeshMCPServer, dict]) -> None:
+        _, result = initialized
         assert "tools" in result["capabilities"]
         assert "prompts" in result["capabilities"]
 
-    def test_server_info(self, uninitialized_server: MemoryMeshMCPServer, tmp_path) -> None:
-        with patch.dict(os.environ, {"MEMORYMESH_PATH": str(tmp_path / "p.db")}):
-            result = uninitialized_server._handle_initialize({})
+    def test_server_info(self, initialized: tuple[MemoryMeshMCPServer, dict]) -> None:
+        _, result = initialized
         assert result["serverInfo"]["name"] == "memorymesh"
         assert result["serverInfo"]["version"] == __version__
 
-    def test_sets_initialized_flag(
-        self, uninitialized_server: MemoryMeshMCPServer, tmp_path
-    ) -> None:
-        assert uninitialized_server._initialized is False
-        with patch.dict(os.environ, {"MEMORYMESH_PATH": str(tmp_path / "p.db")}):
-            uninitialized_server._handle_initialize({})
-        assert uninitialized_server._initialized is True
+    def test_sets_initialized_flag(self, initialized: tuple[MemoryMeshMCPServer, dict]) -> None:
+        assert MemoryMeshMCPServer()._initialized is False
+        s, _ = initialized
+        assert s._initialized is True
 
-    def test_extracts_client_name(
-        self, uninitialized_server: MemoryMeshMCPServer, tmp_path
-    ) -> None:
-        with patch.dict(os.environ, {"MEMORYMESH_PATH": str(tmp_path / "p.db")}):
-            uninitialized_server._handle_initialize({"clientInfo": {"name": "cursor"}})
-        assert uninitialized_server._client_name == "cursor"
+    def test_default_client_name(self, initialized: tuple[MemoryMeshMCPServer, dict]) -> None:
+        s, _ = initialized
+        assert s._client_name == "unknown"
 
-    def test_default_client_name(self, uninitialized_server: MemoryMeshMCPServer, tmp_path) -> None:
-        with patch.dict(os.environ, {"MEMORYMESH_PATH": str(tmp_path / "p.db")}):
-            uninitialized_server._handle_initialize({})
-        assert uninitialized_server._client_name == "unknown"
+    def test_extracts_client_name(self, uninitialized_server: MemoryMeshMCPServer) -> None:
+        uninitialized_server._handle_initialize({"clientInfo": {"name": "cursor"}})
+        assert uninitialized_server._client_name == "cursor"
 
     def test_project_root_from_roots(
         self, uninitialized_server: MemoryMeshMCPServer, tmp_path
@@ -754,13 +774,10 @@ class TestHandleInitialize:
         # Mock detect_project_root to isolate from URI parsing (which
         # differs across platforms) and test that _handle_initialize
         # forwards roots and stores the result.
-        with (
-            patch(
-                "memorymesh.mcp_server.detect_project_root",
-                return_value=project_dir,
-            ) as mock_detect,
-            patch.dict(os.environ, {"MEMORYMESH_EMBEDDING": "none"}, clear=False),
-        ):
+        with patch(
+            "memorymesh.mcp_server.detect_project_root",
+            return_value=project_dir,
+        ) as mock_detect:
             roots = [{"uri": f"file://{project_dir}"}]
             uninitialized_server._handle_initialize({"roots": roots})
             mock_detect.assert_called_once()
@@ -869,65 +886,39 @@ class TestHandlePromptsGet:
 class TestHandleMessage:
     """Tests for the top-level message dispatcher."""
 
-    def test_known_method(self, server: MemoryMeshMCPServer) -> None:
-        """A known method with an id should produce a stdout response."""
-        import io
-
-        buf = io.StringIO()
-        with patch("sys.stdout", buf):
-            server._handle_message({"jsonrpc": "2.0", "id": 1, "method": "ping"})
-        msg = json.loads(buf.getvalue().strip())
+    def test_known_method(self, buffered_server: MemoryMeshMCPServer) -> None:
+        """A known method with an id should produce a response."""
+        buffered_server._handle_message({"jsonrpc": "2.0", "id": 1, "method": "ping"})
+        msg = _written_message(buffered_server)
         assert msg["id"] == 1
         assert "result" in msg
 
-    def test_unknown_method_with_id(self, server: MemoryMeshMCPServer) -> None:
+    def test_unknown_method_with_id(self, buffered_server: MemoryMeshMCPServer) -> None:
         """An unknown method with an id should produce an error response."""
-        import io
-
-        buf = io.StringIO()
-        with patch("sys.stdout", buf):
-            server._handle_message({"jsonrpc": "2.0", "id": 2, "method": "unknown/method"})
-        msg = json.loads(buf.getvalue().strip())
+        buffered_server._handle_message({"jsonrpc": "2.0", "id": 2, "method": "unknown/method"})
+        msg = _written_message(buffered_server)
         assert msg["error"]["code"] == -32601
 
-    def test_unknown_method_without_id(self, server: MemoryMeshMCPServer) -> None:
+    def test_unknown_method_without_id(self, buffered_server: MemoryMeshMCPServer) -> None:
         """An unknown notification (no id) should be silently ignored."""
-        import io
-
-        buf = io.StringIO()
-        with patch("sys.stdout", buf):
-            server._handle_message({"jsonrpc": "2.0", "method": "unknown/notification"})
-        assert buf.getvalue() == ""
-
-    def test_missing_method(self, server: MemoryMeshMCPServer) -> None:
-        import io
+        buffered_server._handle_message({"jsonrpc": "2.0", "method": "unknown/notification"})
+        assert _written_message(buffered_server) is None
 
-        buf = io.StringIO()
-        with patch("sys.stdout", buf):
-            server._handle_message({"jsonrpc": "2.0", "id": 3})
-        msg = json.loads(buf.getvalue().strip())
+    def test_missing_method(self, buffered_server: MemoryMeshMCPServer) -> None:
+        buffered_server._handle_message({"jsonrpc": "2.0", "id": 3})
+        msg = _written_message(buffered_server)
         assert msg["error"]["code"] == -32600
 
-    def test_non_dict_message(self, server: MemoryMeshMCPServer) -> None:
-        import io
-
-        buf = io.StringIO()
-        with patch("sys.stdout", buf):
-            server._handle_message("not a dict")  # type: ignore[arg-type]
-        msg = json.loads(buf.getvalue().strip())
+    def test_non_dict_message(self, buffered_server: MemoryMeshMCPServer) -> None:
+        buffered_server._handle_message("not a dict")  # type: ignore[arg-type]
+        msg = _written_message(buffered_server)
         assert msg["error"]["code"] == -32600
 
-    def test_handler_exception(self, server: MemoryMeshMCPServer) -> None:
+    def test_handler_exception(self, buffered_server: MemoryMeshMCPServer) -> None:
         """If a handler raises, return internal error."""
-        import io
-
-        buf = io.StringIO()
-        with (
-            patch.object(server, "_handle_ping", side_effect=RuntimeError("boom")),
-            patch("sys.stdout", buf),
-        ):
-            server._handle_message({"jsonrpc": "2.0", "id": 4, "method": "ping"})
-        msg = json.loads(buf.getvalue().strip())
+        with patch.object(buffered_server, "_handle_ping", side_effect=RuntimeError("boom")):
+            buffered_server._handle_message({"jsonrpc": "2.0", "id": 4, "method": "ping"})
+        msg = _written_message(buffered_server)
         assert msg["error"]["code"] == -32603
 
 
@@ -991,95 +982,80 @@ class TestToolsCallGuards:
 class TestCreateMeshFromEnv:
     """Tests for _create_mesh_from_env factory method."""
 
-    def test_default_embedding(self, tmp_path) -> None:
-        env = {
-            "MEMORYMESH_PATH": str(tmp_path / "p.db"),
-            "MEMORYMESH_EMBEDDING": "none",
-        }
-        with patch.dict(os.environ, env, clear=False):
-            mesh = MemoryMeshMCPServer._create_mesh_from_env()
+    def test_default_embedding(self, track_mesh) -> None:
+        with patch.dict(os.environ, _IN_MEMORY_ENV, clear=False):
+            mesh = track_mesh(MemoryMeshMCPServer._create_mesh_from_env())
         assert mesh is not None
-        mesh.close()
 
-    def test_memorymesh_path_env(self, tmp_path) -> None:
+    def test_memorymesh_path_env(self, tmp_path, track_mesh) -> None:
         db_path = str(tmp_path / "env_test.db")
-        env = {"MEMORYMESH_PATH": db_path, "MEMORYMESH_EMBEDDING": "none"}
+        env = {**_IN_MEMORY_ENV, "MEMORYMESH_PATH": db_path}
         with patch.dict(os.environ, env, clear=False):
-            mesh = MemoryMeshMCPServer._create_mesh_from_env()
+            mesh = track_mesh(MemoryMeshMCPServer._create_mesh_from_env())
         assert mesh.project_path == db_path
-        mesh.close()
 
-    def test_project_root_param(self, tmp_path) -> None:
+    def test_project_root_param(self, tmp_path, track_mesh) -> None:
         project_dir = tmp_path / "proj"
         project_dir.mkdir()
-        env = {"MEMORYMESH_EMBEDDING": "none"}
+        env = {"MEMORYMESH_GLOBAL_PATH": ":memory:", "MEMORYMESH_EMBEDDING": "none"}
         # Remove MEMORYMESH_PATH from env so project_root is used
         clean_env = {k: v for k, v in os.environ.items() if k != "MEMORYMESH_PATH"}
         clean_env.update(env)
         with patch.dict(os.environ, clean_env, clear=True):
-            mesh = MemoryMeshMCPServer._create_mesh_from_env(project_root=str(project_dir))
+            mesh = track_mesh(
+                MemoryMeshMCPServer._create_mesh_from_env(project_root=str(project_dir))
+            )
         expected = os.path.join(str(project_dir), ".memorymesh", "memories.db")
         assert mesh.project_path == expected
-        mesh.close()
 
-    def test_path_overrides_root(self, tmp_path) -> None:
+    def test_path_overrides_root(self, tmp_path, track_mesh) -> None:
         """MEMORYMESH_PATH should take precedence over project_root."""
         explicit_path = str(tmp_path / "explicit.db")
-        env = {
-            "MEMORYMESH_PATH": explicit_path,
-            "MEMORYMESH_EMBEDDING": "none",
-        }
+        env = {**_IN_MEMORY_ENV, "MEMORYMESH_PATH": explicit_path}
         with patch.dict(os.environ, env, clear=False):
-            mesh = MemoryMeshMCPServer._create_mesh_from_env(project_root=str(tmp_path))
+            mesh = track_mesh(MemoryMeshMCPServer._create_mesh_from_env(project_root=str(tmp_path)))
         assert mesh.project_path == explicit_path
-        mesh.close()
 
-    def test_global_path_env(self, tmp_path) -> None:
+    def test_global_path_env(self, tmp_path, track_mesh) -> None:
         gpath = str(tmp_path / "custom_global.db")
         env = {
             "MEMORYMESH_GLOBAL_PATH": gpath,
             "MEMORYMESH_EMBEDDING": "none",
-            "MEMORYMESH_PATH": str(tmp_path / "p.db"),
+            "MEMORYMESH_PATH": ":memory:",
         }
         with patch.dict(os.environ, env, clear=False):
-            mesh = MemoryMeshMCPServer._create_mesh_from_env()
+            mesh = track_mesh(MemoryMeshMCPServer._create_mesh_from_env())
         assert mesh.global_path == gpath
-        mesh.close()
 
-    def test_ollama_model_env(self, tmp_path) -> None:
+    def test_ollama_model_env(self, track_mesh) -> None:
         """MEMORYMESH_OLLAMA_MODEL should be forwarded."""
         env = {
-            "MEMORYMESH_EMBEDDING": "none",
+            **_IN_MEMORY_ENV,
             "MEMORYMESH_OLLAMA_MODEL": "nomic-embed-text",
-            "MEMORYMESH_PATH": str(tmp_path / "p.db"),
         }
         with patch.dict(os.environ, env, clear=False):
-            mesh = MemoryMeshMCPServer._create_mesh_from_env()
+            track_mesh(MemoryMeshMCPServer._create_mesh_from_env())
         # Should not raise -- the model param is only used when embedding=ollama
-        mesh.close()
 
-    def test_weights_from_env(self, tmp_path) -> None:
+    def test_weights_from_env(self, track_mesh) -> None:
         env = {
-            "MEMORYMESH_EMBEDDING": "none",
-            "MEMORYMESH_PATH": str(tmp_path / "p.db"),
+            **_IN_MEMORY_ENV,
             "MEMORYMESH_WEIGHT_SIMILARITY": "0.8",
             "MEMORYMESH_WEIGHT_RECENCY": "0.1",
         }
         with patch.dict(os.environ, env, clear=False):
-            mesh = MemoryMeshMCPServer._create_mesh_from_env()
+            track_mesh(MemoryMeshMCPServer._create_mesh_from_env())
         # Should not raise
-        mesh.close()
 
 
 class TestMain:
     """Tests for the main() entry point."""
 
-    def test_debug_logging(self, tmp_path) -> None:
+    def test_debug_logging(self) -> None:
         """MEMORYMESH_DEBUG should set DEBUG level."""
         env = {
+            **_IN_MEMORY_ENV,
             "MEMORYMESH_DEBUG": "1",
-            "MEMORYMESH_EMBEDDING": "none",
-            "MEMORYMESH_PATH": str(tmp_path / "p.db"),
         }
         with (
             patch.dict(os.environ, env, clear=False),
@@ -1090,10 +1066,9 @@ class TestMain:
                 main()
             assert exc_info.value.code == 0
 
-    def test_keyboard_interrupt(self, tmp_path) -> None:
+    def test_keyboard_interrupt(self) -> None:
         env = {
-            "MEMORYMESH_EMBEDDING": "none",
-            "MEMORYMESH_PATH": str(tmp_path / "p.db"),
+            **_IN_MEMORY_ENV,
         }
         with (
             patch.dict(os.environ, env, clear=False),
@@ -8,8 +8,10 @@ from __future__ import annotations
 
 import logging
 import sqlite3
+from collections.abc import Iterator
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+
+import pytest
 
 from memorymesh.memory import Memory
 from memorymesh.migrations import (
@@ -20,10 +22,6 @@ from memorymesh.migrations import (
 )
 from memorymesh.store import MemoryStore
 
-if TYPE_CHECKING:
-    import pytest
-
-
 # ------------------------------------------------------------------
 # Helpers
 # ------------------------------------------------------------------
@@ -52,20 +50,20 @@ _V0_CREATE_INDEX_UPDATED = """
 """
 
 
-def _create_v0_database(path: str) -> None:
-    """Create a database with the v0.1.0 schema (no user_version set)."""
-    conn = sqlite3.connect(path)
+def _create_v0_database(conn: sqlite3.Connection) -> None:
+    """Create the v0.1.0 schema (no user_version set) on *conn*.
+
+    Nothing is committed.  Tests clone the schema from the
+    :func:`v0_template` fixture rather than calling this directly.
+    """
     conn.execute(_V0_CREATE_TABLE)
     conn.execute(_V0_CREATE_INDEX_IMPORTANCE)
     conn.execute(_V0_CREATE_INDEX_UPDATED)
-    conn.commit()
-    conn.close()
 
 
-def _insert_raw_memory(path: str, memory_id: str, text: str) -> None:
+def _insert_raw_memory(conn: sqlite3.Connection, memory_id: str, text: str) -> None:
     """Insert a memory row via raw SQL into an existing database."""
     now = datetime.now(timezone.utc).isoformat()
-    conn = sqlite3.connect(path)
     conn.execute(
         """
         INSERT INTO memories (id, text, metadata_json, created_at, updated_at,
@@ -74,7 +72,15 @@ def _insert_raw_memory(path: str, memory_id: str, text: str) -> None:
         """,
         (memory_id, text, now, now),
     )
+
+
+@pytest.fixture(scope="module")
+def v0_template() -> Iterator[sqlite3.Connection]:
+    """An in-memory v0 database, built once and cloned with ``backup()``."""
+    conn = sqlite3.connect(":memory:")
+    _create_v0_database(conn)
     conn.commit()
+    yield conn
     conn.close()
 
 
@@ -86,17 +92,14 @@ def _insert_raw_memory(path: str, memory_id: str, text: str) -> None:
 class TestFreshInstall:
     """Tests for creating a brand new database."""
 
-    def test_fresh_install_creates_schema(self, tmp_path: object) -> None:
+    def test_fresh_install_creates_schema(self) -> None:
         """New DB gets the latest schema and correct version."""
-        db_path = str(tmp_path / "fresh.db")  # type: ignore[operator]
-        conn = sqlite3.connect(db_path)
+        conn = sqlite3.connect(":memory:")
         version = ensure_schema(conn)
-        conn.close()
 
         assert version == LATEST_VERSION
 
         # Verify table and indexes exist
-        conn = sqlite3.connect(db_path)
         cur = conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='memories'")
         assert cur.fetchone() is not None
 
@@ -108,9 +111,9 @@ class TestFreshInstall:
         assert "idx_memories_updated_at" in indexes
         conn.close()
 
-    def test_fresh_install_crud_works(self, tmp_path: object) -> None:
+    def test_fresh_install_crud_works(self) -> None:
         """Basic save/get works on a fresh database."""
-        store = MemoryStore(path=str(tmp_path / "crud.db"))  # type: ignore[operator]
+        store = MemoryStore(path=":memory:")
         mem = Memory(text="Hello from migrations test")
         store.save(mem)
 
@@ -145,12 +148,11 @@ class TestFreshInstall:
 class TestExistingV0Database:
     """Tests for upgrading a pre-migration database."""
 
-    def test_existing_v0_stamped(self, tmp_path: object) -> None:
+    def test_existing_v0_stamped(self, v0_template: sqlite3.Connection) -> None:
         """Pre-migration DB gets stamped to v1 without errors."""
-        db_path = str(tmp_path / "v0.db")  # type: ignore[operator]
-        _create_v0_database(db_path)
+        conn = sqlite3.connect(":memory:")
+        v0_template.backup(conn)
 
-        conn = sqlite3.connect(db_path)
         assert get_schema_version(conn) == 0
 
         version = ensure_schema(conn)
@@ -158,15 +160,18 @@ class TestExistingV0Database:
         assert get_schema_version(conn) == LATEST_VERSION
         conn.close()
 
-    def test_existing_v0_data_preserved(self, tmp_path: object) -> None:
+    def test_existing_v0_data_preserved(
+        self, tmp_path: object, v0_template: sqlite3.Connection
+    ) -> None:
         """Memories inserted before migration survive the upgrade."""
         db_path = str(tmp_path / "v0_data.db")  # type: ignore[operator]
-        _create_v0_database(db_path)
-        _insert_raw_memory(db_path, "mem-001", "Important decision")
-        _insert_raw_memory(db_path, "mem-002", "Architecture note")
+        conn = sqlite3.connect(db_path)
+        v0_template.backup(conn)
+        _insert_raw_memory(conn, "mem-001", "Important decision")
+        _insert_raw_memory(conn, "mem-002", "Architecture note")
+        conn.commit()
 
         # Run migration
-        conn = sqlite3.connect(db_path)
         ensure_schema(conn)
         conn.close()
 
@@ -181,11 +186,16 @@ class TestExistingV0Database:
         assert mem2.text == "Architecture note"
         store.close()
 
-    def test_existing_v0_reopen_idempotent(self, tmp_path: object) -> None:
+    def test_existing_v0_reopen_idempotent(
+        self, tmp_path: object, v0_template: sqlite3.Connection
+    ) -> None:
         """Upgraded DB stays at correct version on reopen."""
         db_path = str(tmp_path / "v0_reopen.db")  # type: ignore[operator]
-        _create_v0_database(db_path)
-        _insert_raw_memory(db_path, "mem-persist", "Should survive")
+        conn = sqlite3.connect(db_path)
+        v0_template.backup(conn)
+        _insert_raw_memory(conn, "mem-persist", "Should survive")
+        conn.commit()
+        conn.close()
 
         # First open via MemoryStore triggers migration
         store = MemoryStore(path=db_path)
@@ -207,9 +217,9 @@ class TestExistingV0Database:
 class TestSchemaVersionProperty:
     """Tests for the store.schema_version property."""
 
-    def test_schema_version_property(self, tmp_path: object) -> None:
+    def test_schema_version_property(self) -> None:
         """store.schema_version returns the correct value."""
-        store = MemoryStore(path=str(tmp_path / "version.db"))  # type: ignore[operator]
+        store = MemoryStore(path=":memory:")
         assert store.schema_version == LATEST_VERSION
         store.close()
 
@@ -222,12 +232,10 @@ class TestSchemaVersionProperty:
 class TestEdgeCases:
     """Tests for edge cases in the migration system."""
 
-    def test_migration_skipped_when_current(self, tmp_path: object) -> None:
+    def test_migration_skipped_when_current(self) -> None:
         """No migration runs if the database is already at the latest version."""
-        db_path = str(tmp_path / "current.db")  # type: ignore[operator]
-
         # Create and migrate
-        conn = sqlite3.connect(db_path)
+        conn = sqlite3.connect(":memory:")
         v1 = ensure_schema(conn)
         assert v1 == LATEST_VERSION
 
@@ -236,12 +244,9 @@ class TestEdgeCases:
         assert v2 == LATEST_VERSION
         conn.close()
 
-    def test_future_version_warning(
-        self, tmp_path: object, caplog: pytest.LogCaptureFixture
-    ) -> None:
+    def test_future_version_warning(self, caplog: pytest.LogCaptureFixture) -> None:
         """user_version > LATEST_VERSION logs a warning and does not error."""
-        db_path = str(tmp_path / "future.db")  # type: ignore[operator]
-        conn = sqlite3.connect(db_path)
+        conn = sqlite3.connect(":memory:")
 
         # Create schema and set a future version
         for stmt in _FULL_SCHEMA:
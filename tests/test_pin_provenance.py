@@ -38,7 +38,6 @@ def mesh(tmp_dir: str) -> Generator[MemoryMesh, None, None]:
 def mcp_server(mesh: MemoryMesh) -> MemoryMeshMCPServer:
     """Create an MCP server wrapping the test mesh."""
     server = MemoryMeshMCPServer(mesh=mesh)
-    server._initialized = True
     return server
 
 
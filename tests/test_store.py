@@ -9,6 +9,8 @@ from __future__ import annotations
 
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import pytest
+
 from memorymesh.memory import Memory
 from memorymesh.store import MemoryStore
 
@@ -37,6 +39,32 @@ def test_create_store(tmp_path):
     store.close()
 
 
+def test_create_in_memory_store(tmp_path, monkeypatch):
+    """A ``:memory:`` store keeps data in RAM and never creates a file."""
+    monkeypatch.chdir(tmp_path)
+    store = MemoryStore(path=":memory:")
+    assert store.schema_version > 0
+    assert list(tmp_path.iterdir()) == []
+    store.close()
+
+
+def test_in_memory_store_shared_across_threads_not_instances():
+    """Per-thread connections see one database; separate stores stay isolated."""
+    store = MemoryStore(path=":memory:")
+    other = MemoryStore(path=":memory:")
+    mem = _make_memory("Visible from every thread")
+    store.save(mem)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        retrieved = executor.submit(store.get, mem.id).result()
+
+    assert retrieved is not None
+    assert retrieved.text == mem.text
+    assert other.count() == 0
+    other.close()
+    store.close()
+
+
 # ------------------------------------------------------------------
 # Save and get
 # ------------------------------------------------------------------
@@ -57,6 +85,78 @@ def test_save_and_get(tmp_path):
     store.close()
 
 
+def test_save_many(tmp_path):
+    """save_many persists every memory in one call."""
+    store = MemoryStore(path=tmp_path / "test.db")
+    mems = [_make_memory(f"Batch memory {i}") for i in range(5)]
+    store.save_many(mems)
+
+    assert store.count() == 5
+    for mem in mems:
+        retrieved = store.get(mem.id)
+        assert retrieved is not None
+        assert retrieved.text == mem.text
+    store.close()
+
+
+def test_save_many_empty(tmp_path):
+    """save_many with no memories is a no-op."""
+    store = MemoryStore(path=tmp_path / "test.db")
+    store.save_many([])
+    assert store.count() == 0
+    store.close()
+
+
+def test_transaction_commits_once_on_exit(tmp_path):
+    """Writes inside transaction() are only visible to others after exit."""
+    path = tmp_path / "test.db"
+    store = MemoryStore(path=path)
+    other = MemoryStore(path=path)
+    first, second = _make_memory("First"), _make_memory("Second")
+
+    with store.transaction():
+        store.save(first)
+        store.save(second)
+        assert store.count() == 2
+        assert other.count() == 0
+
+    assert other.count() == 2
+    other.close()
+    store.close()
+
+
+def test_transaction_rolls_back_on_error(tmp_path):
+    """An exception inside transaction() discards every write in the block."""
+    store = MemoryStore(path=tmp_path / "test.db")
+    kept = _make_memory("Kept")
+    store.save(kept)
+
+    with pytest.raises(RuntimeError), store.transaction():
+        store.save(_make_memory("Discarded"))
+        store.delete(kept.id)
+        raise RuntimeError("boom")
+
+    assert store.count() == 1
+    assert store.get(kept.id) is not None
+    store.close()
+
+
+def test_transaction_nested_commits_at_outermost(tmp_path):
+    """Nested transaction() blocks defer the commit to the outermost one."""
+    path = tmp_path / "test.db"
+    store = MemoryStore(path=path)
+    other = MemoryStore(path=path)
+
+    with store.transaction():
+        with store.transaction():
+            store.save(_make_memory("Nested"))
+        assert other.count() == 0
+
+    assert other.count() == 1
+    other.close()
+    store.close()
+
+
 # ------------------------------------------------------------------
 # Delete
 # ------------------------------------------------------------------
@@ -108,6 +208,19 @@ def test_list_all(tmp_path):
     store.close()
 
 
+def test_iter_columns(tmp_path):
+    """iter_columns streams the requested scalar columns as tuples."""
+    store = MemoryStore(path=tmp_path / "test.db")
+    mem = _make_memory("Only one")
+    store.save(mem)
+
+    assert list(store.iter_columns(("id", "importance"))) == [(mem.id, mem.importance)]
+    with pytest.raises(ValueError, match="text"):
+        store.iter_columns(("id", "text"))
+
+    store.close()
+
+
 # ------------------------------------------------------------------
 # Count
 # ------------------------------------------------------------------